@@ -5,11 +5,23 @@ This package contains Streamlit-based UI components for each section
 of the systematic chest radiograph analysis.
 """
 
-from .technical_quality import technical_quality_assessor
-from .anatomy_analyzer import anatomy_systematic_review
-from .pattern_recognizer import pattern_analysis
-from .case_study import interactive_case_study
-from .report_generator import generate_structured_report
+from importlib import import_module
+
+# Public name -> submodule; submodules are imported on first access so
+# loading one page does not import every component
+_EXPORTS = {
+    "technical_quality_assessor": "technical_quality",
+    "anatomy_systematic_review": "anatomy_analyzer",
+    "pattern_analysis": "pattern_recognizer",
+    "interactive_case_study": "case_study",
+    "generate_structured_report": "report_generator"
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "technical_quality_assessor",
@@ -1,175 +1,243 @@
 import streamlit as st
-from typing import Dict, List
-import json
+from types import MappingProxyType
+from typing import Dict, List, Tuple
+
+_SYSTEMATIC_INFO_MD = """
+**Systematic Approach (Klein & Guilleman):** Follow the sequence:
+1. Support/Monitoring Devices → 2. Chest Wall → 3. Mediastinum → 4. Hila → 
+5. Lungs → 6. Airways → 7. Pleura/Diaphragm
+"""
+
+_DEVICE_CHECKLIST_MD = """
+**Checklist:**
+- [ ] Endotracheal tube position (tip 3-5cm above carina)
+- [ ] Central venous catheter (tip in SVC)
+- [ ] Nasogastric tube (below diaphragm)
+- [ ] Pacemaker/ICD leads
+- [ ] Chest tubes
+- [ ] Intra-aortic balloon pump
+"""
+
+_MEDIASTINUM_SECTIONS = MappingProxyType({
+    "Heart": ("Size (CTR <50%)", "Borders sharp", "Apex position"),
+    "Aorta": ("Arch contour", "Calcification", "Tortuosity"),
+    "SVC/IVC": ("Right border visible", "Azygos arch <1cm"),
+    "Lines/Stripes": ("Anterior junction line", "Posterior junction line",
+                      "Paratracheal stripes", "Azygoesophageal recess")
+})
+
+# (item, widget key) pairs per section, keyed once at import
+_MEDIASTINUM_CHECKS = MappingProxyType({
+    section: tuple((item, f"med_{section}_{item}") for item in items)
+    for section, items in _MEDIASTINUM_SECTIONS.items()
+})
+
+# Summary labels for the analysis_progress keys
+_SECTION_LABELS = MappingProxyType({
+    "devices": "Devices",
+    "chest_wall_checks": "Chest Wall Checks",
+    "chest_wall": "Chest Wall",
+    "mediastinum": "Mediastinum",
+    "hila": "Hila",
+    "lungs": "Lungs",
+    "airways": "Airways",
+    "pleura": "Pleura"
+})
+
+_HILA_NOTES_MD = """
+**Normal:** Right hilum lower than left (97% of cases)
+**Convergence Sign:** Vessels course toward enlarged hilum (vascular)
+"""
 
 def anatomy_systematic_review():
-    st.markdown('<p class="section-header">🔍 Systematic Anatomy Analysis</p>', 
-                unsafe_allow_html=True)
+    st.header("🔍 Systematic Anatomy Analysis")
     
-    st.info("""
-    **Systematic Approach (Klein & Guilleman):** Follow the sequence:
-    1. Support/Monitoring Devices → 2. Chest Wall → 3. Mediastinum → 4. Hila → 
-    5. Lungs → 6. Airways → 7. Pleura/Diaphragm
-    """)
-    
-    # Load knowledge base
-    with open('app/data/knowledge_base.json', 'r') as f:
-        kb = json.load(f)
+    st.info(_SYSTEMATIC_INFO_MD)
     
     # Progress tracker
-    if 'analysis_progress' not in st.session_state:
-        st.session_state.analysis_progress = {}
-    
-    tabs = st.tabs(["Devices", "Chest Wall", "Mediastinum", "Hila", "Lungs", "Airways", "Pleura"])
-    
-    with tabs[0]:  # Devices
-        st.subheader("Support & Monitoring Devices")
-        st.markdown("""
-        **Checklist:**
-        - [ ] Endotracheal tube position (tip 3-5cm above carina)
-        - [ ] Central venous catheter (tip in SVC)
-        - [ ] Nasogastric tube (below diaphragm)
-        - [ ] Pacemaker/ICD leads
-        - [ ] Chest tubes
-        - [ ] Intra-aortic balloon pump
-        """)
-        
+    progress = st.session_state.setdefault('analysis_progress', {})
+    
+    tabs = st.tabs([title for title, _ in _TABS])
+    for tab, (_, render_tab) in zip(tabs, _TABS):
+        with tab:
+            render_tab()
+    
+    # Summary
+    st.markdown("---")
+    st.subheader("Analysis Summary")
+    if st.button("Generate Structured Findings"):
+        generate_findings_summary(progress)
+
+# Each tab is a fragment so widget interactions rerun only that tab
+@st.fragment
+def _tab_devices():
+    st.subheader("Support & Monitoring Devices")
+    st.markdown(_DEVICE_CHECKLIST_MD)
+    
+    with st.form("form_devices", clear_on_submit=False):
         device_findings = st.text_area("Device Findings:", 
                                      placeholder="ETT at T2, CVC tip in SVC, NG tube in stomach...")
-        st.session_state.analysis_progress['devices'] = device_findings
+        submitted = st.form_submit_button("Save Findings")
     
-    with tabs[1]:  # Chest Wall
-        st.subheader("Chest Wall Analysis")
+    if submitted:
+        st.session_state.analysis_progress['devices'] = device_findings
+
+@st.fragment
+def _tab_chest_wall():
+    st.subheader("Chest Wall Analysis")
+    with st.form("form_chest_wall", clear_on_submit=False):
         col1, col2 = st.columns(2)
         
         with col1:
-            st.markdown("**Symmetry Check**")
-            cw_normal = st.checkbox("Symmetric breast shadows", key="cw_sym")
-            ribs_intact = st.checkbox("Ribs intact bilaterally", key="cw_ribs")
-            st_soft = st.checkbox("Normal soft tissues", key="cw_soft")
+            symmetry = st.multiselect("Symmetry Check",
+                                      ["Symmetric breast shadows", "Ribs intact bilaterally",
+                                       "Normal soft tissues"],
+                                      key="cw_symmetry")
         
         with col2:
-            st.markdown("**Abnormalities to Exclude**")
-            pectus = st.checkbox("Pectus excavatum (mimics middle lobe disease)")
-            rib_lesion = st.checkbox("Rib destruction (malignancy indicator)")
-            soft_tissue_mass = st.checkbox("Soft tissue mass (incomplete border sign)")
+            abnormalities = st.multiselect("Abnormalities to Exclude",
+                                           ["Pectus excavatum (mimics middle lobe disease)",
+                                            "Rib destruction (malignancy indicator)",
+                                            "Soft tissue mass (incomplete border sign)"],
+                                           key="cw_abnormalities")
         
         cw_findings = st.text_area("Chest Wall Findings:")
+        submitted = st.form_submit_button("Save Findings")
+    
+    if submitted:
+        st.session_state.analysis_progress['chest_wall_checks'] = symmetry + abnormalities
         st.session_state.analysis_progress['chest_wall'] = cw_findings
+
+@st.fragment
+def _tab_mediastinum():
+    st.subheader("Mediastinum Assessment")
     
-    with tabs[2]:  # Mediastinum
-        st.subheader("Mediastinum Assessment")
-        
-        mediastinum_sections = {
-            "Heart": ["Size (CTR <50%)", "Borders sharp", "Apex position"],
-            "Aorta": ["Arch contour", "Calcification", "Tortuosity"],
-            "SVC/IVC": ["Right border visible", "Azygos arch <1cm"],
-            "Lines/Stripes": ["Anterior junction line", "Posterior junction line", 
-                            "Paratracheal stripes", "Azygoesophageal recess"]
-        }
-        
-        for section, items in mediastinum_sections.items():
-            with st.expander(f"**{section}**"):
-                for item in items:
-                    st.checkbox(item, key=f"med_{section}_{item}")
+    with st.form("form_mediastinum", clear_on_submit=False):
+        for section, checks in _MEDIASTINUM_CHECKS.items():
+            _render_med_section(section, checks)
         
         med_findings = st.text_area("Mediastinal Findings:")
+        submitted = st.form_submit_button("Save Findings")
+    
+    if submitted:
         st.session_state.analysis_progress['mediastinum'] = med_findings
+
+def _render_med_section(section: str, checks: Tuple[Tuple[str, str], ...]):
+    with st.expander(f"**{section}**"):
+        for item, key in checks:
+            st.checkbox(item, key=key)
+
+@st.fragment
+def _tab_hila():
+    st.subheader("Hilar Analysis")
+    st.markdown(_HILA_NOTES_MD)
     
-    with tabs[3]:  # Hila
-        st.subheader("Hilar Analysis")
-        st.markdown("""
-        **Normal:** Right hilum lower than left (97% of cases)
-        **Convergence Sign:** Vessels course toward enlarged hilum (vascular)
-        """)
-        
-        hilum_positions = st.radio("Hilum Position:", 
-                                  ["Normal (R<L)", "Same level", "Abnormal (R>L or elevated)"])
-        hilar_size = st.radio("Hilar Size:", ["Normal", "Enlarged", "Prominent vessels"])
-        
-        if hilar_size == "Enlarged":
-            st.multiselect("Differential:", 
-                         ["Lymphadenopathy", "Central neoplasm", "Pulmonary hypertension"])
-        
-        hilar_findings = st.text_area("Hilar Findings:")
-        st.session_state.analysis_progress['hila'] = hilar_findings
+    hilum_positions = st.radio("Hilum Position:", 
+                              ["Normal (R<L)", "Same level", "Abnormal (R>L or elevated)"])
+    hilar_size = st.radio("Hilar Size:", ["Normal", "Enlarged", "Prominent vessels"])
     
-    with tabs[4]:  # Lungs
-        st.subheader("Lung Parenchyma Analysis")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("**Volumes**")
-            volumes = st.radio("Lung Volumes:", 
-                             ["Normal", "Hyperinflated", "Reduced", "Asymmetric"])
-            
-            st.markdown("**Pattern**")
-            pattern = st.selectbox("Predominant Pattern:", 
-                                 ["Normal", "Air space opacity", "Interstitial reticular",
-                                  "Interstitial nodular", "Mixed", "Destructive"])
-        
-        with col2:
-            st.markdown("**Distribution**")
-            distribution = st.multiselect("Distribution:", 
-                                        ["Upper zone", "Lower zone", "Central/perihilar",
-                                         "Peripheral", "Diffuse", "Unilateral"])
-            
-            st.markdown("**Specific Findings**")
-            nodules = st.checkbox("Solitary pulmonary nodule")
-            masses = st.checkbox("Pulmonary mass (≥3cm)")
-            effusion = st.checkbox("Pleural effusion")
-        
-        if nodules:
-            st.warning("⚠️ SPN detected: Requires thin-section CT characterization")
-            st.markdown("**Malignancy features:** Spiculation, irregular margins, >3cm")
-        
-        lung_findings = st.text_area("Lung Findings:")
-        st.session_state.analysis_progress['lungs'] = lung_findings
+    if hilar_size == "Enlarged":
+        st.multiselect("Differential:", 
+                     ["Lymphadenopathy", "Central neoplasm", "Pulmonary hypertension"])
     
-    with tabs[5]:  # Airways
-        st.subheader("Airway Assessment")
-        
-        trachea = st.radio("Trachea:", ["Midline", "Deviated", "Narrowed"])
-        if trachea == "Deviated":
-            st.selectbox("Direction:", ["Ipsilateral (volume loss)", "Contralateral (mass effect)"])
-        
-        bronchi = st.checkbox("Bronchiectasis signs (tram tracks, ring shadows)")
-        if bronchi:
-            st.selectbox("Type:", ["Cylindrical", "Varicose", "Cystic"])
-        
-        airway_findings = st.text_area("Airway Findings:")
-        st.session_state.analysis_progress['airways'] = airway_findings
+    hilar_findings = st.text_area("Hilar Findings:")
+    st.session_state.analysis_progress['hila'] = hilar_findings
+
+@st.fragment
+def _tab_lungs():
+    st.subheader("Lung Parenchyma Analysis")
     
-    with tabs[6]:  # Pleura/Diaphragm
-        st.subheader("Pleura & Diaphragm")
-        
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Volumes**")
+        volumes = st.radio("Lung Volumes:", 
+                         ["Normal", "Hyperinflated", "Reduced", "Asymmetric"])
+        
+        st.markdown("**Pattern**")
+        pattern = st.selectbox("Predominant Pattern:", 
+                             ["Normal", "Air space opacity", "Interstitial reticular",
+                              "Interstitial nodular", "Mixed", "Destructive"])
+    
+    with col2:
+        st.markdown("**Distribution**")
+        distribution = st.multiselect("Distribution:", 
+                                    ["Upper zone", "Lower zone", "Central/perihilar",
+                                     "Peripheral", "Diffuse", "Unilateral"])
+        
+        st.markdown("**Specific Findings**")
+        nodules = st.checkbox("Solitary pulmonary nodule")
+        masses = st.checkbox("Pulmonary mass (≥3cm)")
+        effusion = st.checkbox("Pleural effusion")
+    
+    if nodules:
+        st.warning("⚠️ SPN detected: Requires thin-section CT characterization")
+        st.markdown("**Malignancy features:** Spiculation, irregular margins, >3cm")
+    
+    lung_findings = st.text_area("Lung Findings:")
+    st.session_state.analysis_progress['lungs'] = lung_findings
+
+@st.fragment
+def _tab_airways():
+    st.subheader("Airway Assessment")
+    
+    trachea = st.radio("Trachea:", ["Midline", "Deviated", "Narrowed"])
+    if trachea == "Deviated":
+        st.selectbox("Direction:", ["Ipsilateral (volume loss)", "Contralateral (mass effect)"])
+    
+    bronchi = st.checkbox("Bronchiectasis signs (tram tracks, ring shadows)")
+    if bronchi:
+        st.selectbox("Type:", ["Cylindrical", "Varicose", "Cystic"])
+    
+    airway_findings = st.text_area("Airway Findings:")
+    st.session_state.analysis_progress['airways'] = airway_findings
+
+@st.fragment
+def _tab_pleura():
+    st.subheader("Pleura & Diaphragm")
+    
+    # Forms cannot show/hide inputs before submit, so the dependent
+    # selectboxes are always shown and only apply when their parent is set
+    with st.form("form_pleura", clear_on_submit=False):
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("**Pleura**")
             pneumothorax = st.checkbox("Pneumothorax (visceral pleural line)")
             pleural_effusion = st.checkbox("Pleural effusion")
-            if pleural_effusion:
-                st.selectbox("Effusion type:", 
-                           ["Small (blunts costophrenic)", "Moderate", "Massive", "Loculated"])
+            st.selectbox("Effusion type (if effusion present):", 
+                       ["Small (blunts costophrenic)", "Moderate", "Massive", "Loculated"])
             pleural_thickening = st.checkbox("Pleural thickening/plaques")
         
         with col2:
             st.markdown("**Diaphragm**")
             diaphragm = st.radio("Diaphragm Contours:", ["Normal", "Elevated", "Flattened"])
-            if diaphragm == "Elevated":
-                st.selectbox("Cause:", ["Weakness/paralysis", "Eventration", "Subpulmonic effusion"])
+            st.selectbox("Cause (if elevated):", 
+                       ["Weakness/paralysis", "Eventration", "Subpulmonic effusion"])
         
         pleura_findings = st.text_area("Pleura/Diaphragm Findings:")
-        st.session_state.analysis_progress['pleura'] = pleura_findings
+        submitted = st.form_submit_button("Save Findings")
     
-    # Summary
-    st.markdown("---")
-    st.subheader("Analysis Summary")
-    if st.button("Generate Structured Findings"):
-        generate_findings_summary(st.session_state.analysis_progress)
+    if submitted:
+        st.session_state.analysis_progress['pleura'] = pleura_findings
+
+# Review order: (tab title, fragment rendering the tab)
+_TABS = (
+    ("Devices", _tab_devices),
+    ("Chest Wall", _tab_chest_wall),
+    ("Mediastinum", _tab_mediastinum),
+    ("Hila", _tab_hila),
+    ("Lungs", _tab_lungs),
+    ("Airways", _tab_airways),
+    ("Pleura", _tab_pleura)
+)
 
 def generate_findings_summary(progress: Dict):
-    st.markdown("### Structured Findings Report")
-    for section, findings in progress.items():
+    # Sections follow the review order, not the order they were saved in;
+    # header and all sections go out as a single markdown element
+    lines = ["### Structured Findings Report"]
+    for section, label in _SECTION_LABELS.items():
+        findings = progress.get(section)
+        if isinstance(findings, list):
+            findings = ", ".join(findings)
         if findings:
-            st.markdown(f"**{section.replace('_', ' ').title()}:** {findings}")
+            lines.append(f"**{label}:** {findings}")
+    st.markdown("\n\n".join(lines))
@@ -6,10 +6,12 @@ from the systematic analysis literature.
 """
 
 import streamlit as st
-from typing import Dict, List, Optional
-import json
+import re
+from typing import Dict, FrozenSet, Mapping, Tuple
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
 
 class CaseDifficulty(Enum):
@@ -18,21 +20,76 @@ class CaseDifficulty(Enum):
     ADVANCED = "advanced"
 
 
-@dataclass
+_CASES_PATH = Path(__file__).resolve().parent.parent / 'data' / 'cases.json'
+
+# Keywords (matched in case title or diagnosis) that place a case in a category
+_CATEGORY_KEYWORDS = {
+    "Air Space Disease": ["pneumonia", "consolidation", "air space"],
+    "Interstitial Lung Disease": ["fibrosis", "interstitial", "reticular"],
+    "Nodules and Masses": ["nodule", "mass", "tumor"],
+    "Pleural Disease": ["pleural", "effusion", "pneumothorax"],
+    "Mediastinal Abnormalities": ["mediastinal", "hilar"],
+    "Technical Quality Issues": ["technical", "pseudo", "poor inspiration"]
+}
+
+# One case-insensitive alternation per category, so each case is classified
+# with a single scan per category instead of one substring test per keyword.
+# No word boundaries: keywords match inside words like the substring test did
+# ("nodules", "effusions", "hydropneumothorax")
+_CATEGORY_PATTERNS = {
+    category: re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+}
+
+# Progressive-disclosure tabs shown for each case
+_CASE_TAB_LABELS = (
+    "📋 History", 
+    "🔍 Image Description", 
+    "📝 Your Analysis",
+    "✅ Key Findings",
+    "🎯 Diagnosis",
+    "📚 Teaching Points"
+)
+
+# Systematic analysis checklist shown in the "Your Analysis" tab
+_CHECKLIST_ITEMS = (
+    "Technical quality assessed",
+    "Devices/lines evaluated",
+    "Chest wall examined",
+    "Mediastinum evaluated",
+    "Hila assessed",
+    "Lung parenchyma analyzed",
+    "Airways checked",
+    "Pleura/diaphragm evaluated"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class CXRCase:
-    """Data class for CXR case studies"""
+    """Data class for CXR case studies (immutable, shared across sessions)"""
     case_id: str
     title: str
     difficulty: CaseDifficulty
     patient_history: str
     clinical_context: str
     image_description: str  # Text description since we may not have actual images
-    findings: Dict[str, str]  # Organized by anatomical region
-    key_findings: List[str]
+    findings: Tuple[Tuple[str, str, str], ...]  # (region, display label, finding) in display order
+    key_findings: Tuple[str, ...]
     diagnosis: str
-    teaching_points: List[str]
-    differentials_considered: List[str]
-    references: List[str]
+    teaching_points: Tuple[str, ...]
+    differentials_considered: Tuple[str, ...]
+    references: Tuple[str, ...]
+    
+    def __post_init__(self):
+        # Frozen dataclass: bypass __setattr__ to normalise JSON-decoded values
+        object.__setattr__(self, 'difficulty', CaseDifficulty(self.difficulty))
+        findings = self.findings
+        if isinstance(findings, Mapping):
+            findings = ((region, region.replace('_', ' ').title(), finding) 
+                        for region, finding in findings.items())
+        object.__setattr__(self, 'findings', tuple(findings))
+        for name in ('key_findings', 'teaching_points', 'differentials_considered', 'references'):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
 
 def interactive_case_study():
@@ -40,8 +97,7 @@ def interactive_case_study():
     Main function for interactive case study module.
     Provides case-based learning with progressive disclosure.
     """
-    st.markdown('<p class="section-header">📚 Interactive Case Studies</p>', 
-                unsafe_allow_html=True)
+    st.header("📚 Interactive Case Studies")
     
     st.info("""
     **Learning Approach:** Work through real-world cases using the systematic analysis method.
@@ -73,11 +129,15 @@ def interactive_case_study():
         
         # Get available cases
         available_cases = load_cases(difficulty_filter, case_category)
-        selected_case_id = st.selectbox(
-            "Select case:",
-            list(available_cases.keys()),
-            format_func=lambda x: available_cases[x].title
-        )
+        if available_cases:
+            selected_title = st.selectbox(
+                "Select case:",
+                [case.title for case in available_cases.values()]
+            )
+            selected_case_id = _build_title_index().get(selected_title)
+        else:
+            st.warning("No cases match these filters.")
+            selected_case_id = None
     
     with col2:
         if selected_case_id:
@@ -100,388 +160,74 @@ def interactive_case_study():
 
 def load_cases(difficulty_filter: str, category_filter: str) -> Dict[str, CXRCase]:
     """
-    Load case library. In production, this would load from database.
-    For now, using built-in educational cases based on the PDF content.
+    Load case library filtered by difficulty and category.
     """
+    cases = _build_case_library()
     
-    cases = {
-        # Case 1: Air Space Disease - Pneumonia
-        "case_001": CXRCase(
-            case_id="case_001",
-            title="Case 1: Right Upper Lobe Pneumonia",
-            difficulty=CaseDifficulty.BEGINNER,
-            patient_history="""
-            **Patient:** 45-year-old male
-            **Presentation:** 3 days of fever, productive cough, right-sided chest pain
-            **Vitals:** Temp 38.5°C, HR 95, RR 22, BP 130/80
-            **Labs:** WBC 15,000, neutrophilia
-            """,
-            clinical_context="Community-acquired pneumonia, previously healthy",
-            image_description="""
-            **Technical Quality:** Good inspiration, adequate penetration, no motion
-            
-            **Findings:**
-            - Frontal view: Patchy opacity right upper lobe, air bronchograms visible
-            - Right heart border preserved (not silhouetted)
-            - Lateral view: Opacity projects over anterior segment RUL
-            - No pleural effusion, no lymphadenopathy
-            """,
-            findings={
-                "technical": "Adequate technique",
-                "devices": "None present",
-                "chest_wall": "Normal",
-                "mediastinum": "Normal cardiac silhouette, no shift",
-                "hila": "Normal, symmetric",
-                "lungs": "Right upper lobe air space opacity with air bronchograms",
-                "airways": "Trachea midline, no bronchial wall thickening",
-                "pleura": "No effusion or pneumothorax"
-            },
-            key_findings=[
-                "Air space opacity with air bronchograms",
-                "Lobar distribution (RUL)",
-                "Acute clinical presentation"
-            ],
-            diagnosis="Right upper lobe pneumonia (Streptococcus pneumoniae most likely)",
-            teaching_points=[
-                "Air bronchograms indicate air space disease (alveolar filling)",
-                "Preservation of right heart border suggests anterior/posterior location",
-                "Lobar distribution typical of bacterial pneumonia",
-                "Follow-up imaging recommended to ensure resolution (rule out underlying lesion)"
-            ],
-            differentials_considered=[
-                "Pulmonary infarction (clinical context makes less likely)",
-                "Pulmonary hemorrhage (no hemoptysis)",
-                "Cryptogenic organizing pneumonia (subacute presentation)"
-            ],
-            references=["Klein JS - Air space opacification patterns"]
-        ),
-        
-        # Case 2: Interstitial Lung Disease - IPF
-        "case_002": CXRCase(
-            case_id="case_002",
-            title="Case 2: Idiopathic Pulmonary Fibrosis",
-            difficulty=CaseDifficulty.INTERMEDIATE,
-            patient_history="""
-            **Patient:** 68-year-old male, former smoker (40 pack-years)
-            **Presentation:** Progressive dyspnea on exertion over 18 months
-            **Vitals:** SpO2 88% on room air, fine bibasilar crackles
-            **PFTs:** Restrictive pattern, reduced DLCO
-            """,
-            clinical_context="Suspected interstitial lung disease, refer for HRCT",
-            image_description="""
-            **Technical Quality:** Suboptimal inspiration (shallow breathing), adequate penetration
-            
-            **Findings:**
-            - Reduced lung volumes bilaterally
-            - Bilateral basal predominant reticular opacities
-            - Honeycombing suggested at lung bases
-            - Traction bronchiectasis visible
-            - No hilar lymphadenopathy
-            - Cardiac size normal
-            """,
-            findings={
-                "technical": "Suboptimal inspiration due to disease",
-                "devices": "None",
-                "chest_wall": "Normal",
-                "mediastinum": "Normal, no shift",
-                "hila": "Normal, no enlargement",
-                "lungs": "Bilateral basal reticular opacities, volume loss, honeycombing",
-                "airways": "Traction bronchiectasis at bases",
-                "pleura": "No significant pleural disease"
-            },
-            key_findings=[
-                "Bilateral basal reticular pattern",
-                "Reduced lung volumes",
-                "Honeycombing (end-stage fibrosis)",
-                "Traction bronchiectasis",
-                "No upper lobe predominance"
-            ],
-            diagnosis="Usual Interstitial Pneumonia (UIP) pattern - Idiopathic Pulmonary Fibrosis",
-            teaching_points=[
-                "Basal and peripheral predominance characteristic of UIP",
-                "Reticular pattern indicates interstitial disease",
-                "Honeycombing = irreversible fibrosis, poor prognosis",
-                "HRCT required for definitive diagnosis (UIP vs NSIP)",
-                "No role for surgical lung biopsy if definite UIP pattern on HRCT"
-            ],
-            differentials_considered=[
-                "Fibrotic NSIP (more ground glass, less honeycombing)",
-                "Asbestosis (requires exposure history, pleural plaques)",
-                "Collagen vascular disease-related ILD (check autoantibodies)",
-                "Chronic hypersensitivity pneumonitis (upper lobe predominance, air trapping)"
-            ],
-            references=["Klein JS - Interstitial patterns", "UpToDate - UIP/IPF diagnosis"]
-        ),
-        
-        # Case 3: Technical Quality - Poor Inspiration
-        "case_003": CXRCase(
-            case_id="case_003",
-            title="Case 3: Pseudo-Cardiomegaly from Poor Inspiration",
-            difficulty=CaseDifficulty.BEGINNER,
-            patient_history="""
-            **Patient:** 35-year-old female
-            **Presentation:** Pre-operative chest X-ray for elective surgery
-            **Vitals:** Normal
-            **History:** No cardiac symptoms, no risk factors
-            """,
-            clinical_context="Routine pre-op screening",
-            image_description="""
-            **Technical Quality:** Poor inspiratory effort (only 6 posterior ribs visible)
-            
-            **Findings:**
-            - Cardiothoracic ratio appears increased (0.58)
-            - Crowding of bronchovascular markings at bases
-            - Apparent widening of mediastinum
-            - No pulmonary edema
-            - No pleural effusions
-            """,
-            findings={
-                "technical": "Poor inspiration - only 6 posterior ribs above diaphragm",
-                "devices": "None",
-                "chest_wall": "Normal",
-                "mediastinum": "Appears widened due to poor inspiration",
-                "hila": "Normal, appear prominent due to crowding",
-                "lungs": "Crowded vessels at bases, no infiltrates",
-                "airways": "Normal",
-                "pleura": "Normal"
-            },
-            key_findings=[
-                "Poor inspiratory effort (<8 posterior ribs)",
-                "Apparent cardiomegaly (CTR >0.5)",
-                "Crowded bronchovascular markings",
-                "Clinical context inconsistent with heart failure"
-            ],
-            diagnosis="Normal heart size with pseudo-cardiomegaly due to poor inspiration",
-            teaching_points=[
-                "Poor inspiration causes apparent cardiomegaly (CTR falsely elevated)",
-                "Crowding of vessels mimics vascular congestion",
-                "Always assess technical quality before interpreting findings",
-                "Repeat with better inspiration if clinically indicated",
-                "Correlation with clinical context essential"
-            ],
-            differentials_considered=[
-                "Cardiomegaly (clinical context makes unlikely)",
-                "Pericardial effusion (no water bottle configuration)"
-            ],
-            references=["Klein JS - Technical quality assessment"]
-        ),
-        
-        # Case 4: Pleural Disease - Loculated Effusion
-        "case_004": CXRCase(
-            case_id="case_004",
-            title="Case 4: Loculated Pleural Effusion (Empyema)",
-            difficulty=CaseDifficulty.INTERMEDIATE,
-            patient_history="""
-            **Patient:** 52-year-old male with history of IV drug use
-            **Presentation:** Fever, chest pain, productive cough for 1 week
-            **Vitals:** Temp 39°C, HR 110, RR 28
-            **Labs:** WBC 22,000, elevated procalcitonin
-            """,
-            clinical_context="Complicated parapneumonic effusion vs empyema",
-            image_description="""
-            **Technical Quality:** Good technique, upright film
-            
-            **Findings:**
-            - Left lower zone biconvex opacity (D-shaped)
-            - Does not layer dependently
-            - Obscures left hemidiaphragm
-            - No air-fluid level visible
-            - Adjacent lung consolidation
-            - Mediastinum not shifted (trapped lung)
-            """,
-            findings={
-                "technical": "Adequate",
-                "devices": "None",
-                "chest_wall": "Normal",
-                "mediastinum": "Midline, no mass effect",
-                "hila": "Normal",
-                "lungs": "Left lower lobe consolidation adjacent to effusion",
-                "airways": "Normal",
-                "pleura": "Loculated left pleural effusion (biconvex, non-mobile)"
-            },
-            key_findings=[
-                "Biconvex (lenticular) shape - key sign of loculation",
-                "Does not layer with gravity",
-                "Adjacent lung consolidation (pneumonia)",
-                "No mediastinal shift (lung trapped by fibrosis)"
-            ],
-            diagnosis="Loculated parapneumonic effusion, likely evolving empyema",
-            teaching_points=[
-                "Loculated effusions have biconvex (D-shaped) appearance",
-                "Different from free-flowing effusion (meniscus sign)",
-                "Usually indicates infection (parapneumonic) or malignancy",
-                "Requires drainage (chest tube or surgery)",
-                "CT helpful to define extent and plan intervention"
-            ],
-            differentials_considered=[
-                "Free pleural effusion (shape is wrong)",
-                "Pleural mass/tumor (clinical context favors infection)",
-                "Lung abscess (would have air-fluid level)"
-            ],
-            references=["Klein JS - Pleural disease patterns"]
-        ),
-        
-        # Case 5: Nodule - Solitary Pulmonary Nodule
-        "case_005": CXRCase(
-            case_id="case_005",
-            title="Case 5: Solitary Pulmonary Nodule - Malignancy",
-            difficulty=CaseDifficulty.ADVANCED,
-            patient_history="""
-            **Patient:** 58-year-old male, 30 pack-year smoking history
-            **Presentation:** Incidental finding on pre-employment CXR
-            **Vitals:** Normal
-            **History:** No prior imaging available for comparison
-            """,
-            clinical_context="Incidental solitary pulmonary nodule - evaluate for malignancy",
-            image_description="""
-            **Technical Quality:** Good inspiration and penetration
-            
-            **Findings:**
-            - 2.3 cm nodule right upper lobe, peripheral location
-            - Spiculated margins (corona radiata sign)
-            - No calcification visible
-            - No satellite lesions
-            - No hilar or mediastinal lymphadenopathy
-            - No pleural effusion
-            """,
-            findings={
-                "technical": "Optimal",
-                "devices": "None",
-                "chest_wall": "Normal",
-                "mediastinum": "No lymphadenopathy",
-                "hila": "Normal",
-                "lungs": "RUL spiculated nodule, 2.3 cm, no calcification",
-                "airways": "Normal",
-                "pleura": "No effusion"
-            },
-            key_findings=[
-                "Solitary pulmonary nodule (>3cm would be mass)",
-                "Spiculated margins (highly suspicious for malignancy)",
-                "Upper lobe location (common for lung cancer)",
-                "No calcification (would suggest benign)",
-                "Risk factors: age, smoking history"
-            ],
-            diagnosis="Highly suspicious for primary lung cancer (T1b if <3cm, no node involvement)",
-            teaching_points=[
-                "Spiculation = malignant sign (corona radiata = desmoplastic reaction)",
-                "Size >2cm increases malignancy risk significantly",
-                "Upper lobe location favors malignancy over benign",
-                "Requires CT chest with contrast for staging",
-                "Tissue diagnosis needed (CT-guided biopsy or surgical)",
-                "Check for extrathoracic metastases (PET-CT, brain MRI)"
-            ],
-            differentials_considered=[
-                "Granuloma (would typically have calcification or be smaller)",
-                "Hamartoma (would have fat/popcorn calcification)",
-                "Metastasis (solitary, no known primary)",
-                "Organizing pneumonia (would have surrounding ground glass)"
-            ],
-            references=["Klein JS - Solitary pulmonary nodule", "Fleischner Society guidelines"]
-        ),
-        
-        # Case 6: Mediastinal Mass
-        "case_006": CXRCase(
-            case_id="case_006",
-            title="Case 6: Anterior Mediastinal Mass - Lymphoma",
-            difficulty=CaseDifficulty.INTERMEDIATE,
-            patient_history="""
-            **Patient:** 28-year-old male
-            **Presentation:** 2 months of cough, weight loss, night sweats
-            **Vitals:** Temp 37.8°C, HR 85
-            **Labs:** Elevated LDH, mild anemia
-            """,
-            clinical_context="B symptoms with mediastinal mass - suspect lymphoma",
-            image_description="""
-            **Technical Quality:** Good
-            
-            **Findings:**
-            - Large lobulated anterior mediastinal mass
-            - Widening of superior mediastinum
-            - Mass silhouettes with cardiac border (anterior location confirmed on lateral)
-            - Bilateral hilar lymphadenopathy
-            - No pleural effusion
-            - Lungs clear
-            """,
-            findings={
-                "technical": "Adequate",
-                "devices": "None",
-                "chest_wall": "Normal",
-                "mediastinum": "Large anterior mediastinal mass, lobulated",
-                "hila": "Bilateral hilar lymphadenopathy",
-                "lungs": "Clear",
-                "airways": "Trachea not significantly deviated",
-                "pleura": "No effusion"
-            },
-            key_findings=[
-                "Anterior mediastinal mass (silhouettes heart on lateral)",
-                "Lobulated contour",
-                "Bilateral hilar involvement",
-                "B symptoms (fever, weight loss, night sweats)",
-                "Young adult male"
-            ],
-            diagnosis="Hodgkin lymphoma (most likely given age and presentation)",
-            teaching_points=[
-                "Anterior mediastinum: 4T's - Thymoma, Teratoma, Thyroid, T-cell lymphoma",
-                "Hodgkin lymphoma commonly presents with mediastinal mass in young adults",
-                "B symptoms indicate systemic disease",
-                "CT chest/abdomen/pelvis needed for staging",
-                "Tissue diagnosis via mediastinoscopy or CT-guided biopsy",
-                "Elevated LDH suggests high tumor burden"
-            ],
-            differentials_considered=[
-                "Thymoma (usually older patients, no B symptoms)",
-                "Germ cell tumor (check AFP, beta-HCG)",
-                "Substernal thyroid (would extend from neck, check thyroid)",
-                "Non-Hodgkin lymphoma (usually older, more aggressive)"
-            ],
-            references=["Klein JS - Mediastinal masses", "Carter BW - ITMIG classification"]
-        )
-    }
+    # Apply filters as set intersections over the precomputed indexes
+    matching_ids = set(cases)
+    if difficulty_filter != "All":
+        matching_ids &= _build_difficulty_index().get(difficulty_filter.lower(), frozenset())
+    if category_filter != "All Categories":
+        matching_ids &= _build_category_index().get(category_filter, frozenset())
     
-    # Apply filters
-    filtered_cases = {}
-    for case_id, case in cases.items():
-        # Difficulty filter
-        if difficulty_filter != "All":
-            if case.difficulty.value != difficulty_filter.lower():
-                continue
-        
-        # Category filter (simplified logic)
-        if category_filter != "All Categories":
-            category_map = {
-                "Air Space Disease": ["pneumonia", "consolidation", "air space"],
-                "Interstitial Lung Disease": ["fibrosis", "interstitial", "reticular"],
-                "Nodules and Masses": ["nodule", "mass", "tumor"],
-                "Pleural Disease": ["pleural", "effusion", "pneumothorax"],
-                "Mediastinal Abnormalities": ["mediastinal", "hilar"],
-                "Technical Quality Issues": ["technical", "pseudo", "poor inspiration"]
-            }
-            keywords = category_map.get(category_filter, [])
-            if not any(kw in case.title.lower() or kw in case.diagnosis.lower() 
-                      for kw in keywords):
-                continue
-        
-        filtered_cases[case_id] = case
+    return {case_id: case for case_id, case in cases.items() 
+            if case_id in matching_ids}
+
+
+@st.cache_resource(show_spinner=False)
+def _build_title_index() -> Dict[str, str]:
+    """Map each case title back to its case id."""
+    return {case.title: case_id for case_id, case in _build_case_library().items()}
+
+
+@st.cache_resource(show_spinner=False)
+def _build_difficulty_index() -> Dict[str, FrozenSet[str]]:
+    """Map each difficulty value to the ids of its cases."""
+    index = defaultdict(set)
+    for case_id, case in _build_case_library().items():
+        index[case.difficulty.value].add(case_id)
+    return {difficulty: frozenset(ids) for difficulty, ids in index.items()}
+
+
+@st.cache_resource(show_spinner=False)
+def _build_category_index() -> Dict[str, FrozenSet[str]]:
+    """Map each category to the ids of cases whose title or diagnosis mentions its keywords."""
+    texts = {case_id: f"{case.title} {case.diagnosis}" 
+             for case_id, case in _build_case_library().items()}
+    return {
+        category: frozenset(case_id for case_id, text in texts.items() if pattern.search(text))
+        for category, pattern in _CATEGORY_PATTERNS.items()
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _build_case_library() -> Dict[str, CXRCase]:
+    """
+    Load the case library once per process. In production, this would load from database.
+    For now, using built-in educational cases (app/data/cases.json) based on the PDF content.
+    """
+    import orjson  # only needed the first time the library is built
     
-    return filtered_cases if filtered_cases else cases
+    raw_cases = orjson.loads(_CASES_PATH.read_bytes())
+    return {data["case_id"]: CXRCase(**data) for data in raw_cases}
 
 
+@st.fragment
 def display_case(case: CXRCase):
     """
     Display selected case with progressive disclosure learning.
+    
+    Runs as a fragment: notes, checklist and diagnosis inputs rerun only
+    the case panel, not the case selectors around it.
     """
     st.markdown(f"### {case.title}")
     st.caption(f"Difficulty: {case.difficulty.value.title()} | Case ID: {case.case_id}")
     
+    case_md = _case_markdown(case.case_id)
+    
     # Create tabs for progressive learning
-    tabs = st.tabs([
-        "📋 History", 
-        "🔍 Image Description", 
-        "📝 Your Analysis",
-        "✅ Key Findings",
-        "🎯 Diagnosis",
-        "📚 Teaching Points"
-    ])
+    tabs = st.tabs(_CASE_TAB_LABELS)
     
     with tabs[0]:
         st.markdown("### Clinical History")
@@ -506,18 +252,7 @@ def display_case(case: CXRCase):
         st.markdown("### Systematic Analysis Checklist")
         
         # Interactive checklist
-        checklist_items = [
-            "Technical quality assessed",
-            "Devices/lines evaluated",
-            "Chest wall examined",
-            "Mediastinum evaluated",
-            "Hila assessed",
-            "Lung parenchyma analyzed",
-            "Airways checked",
-            "Pleura/diaphragm evaluated"
-        ]
-        
-        for item in checklist_items:
+        for item in _CHECKLIST_ITEMS:
             st.checkbox(item, key=f"check_{case.case_id}_{item}")
         
         user_diagnosis = st.text_input("Your differential diagnosis:", 
@@ -528,12 +263,11 @@ def display_case(case: CXRCase):
     
     with tabs[3]:
         st.markdown("### Key Radiographic Findings")
-        for i, finding in enumerate(case.key_findings, 1):
-            st.markdown(f"{i}. {finding}")
+        st.markdown(case_md["key_findings"])
         
         st.markdown("### Findings by Region")
-        for region, finding in case.findings.items():
-            with st.expander(f"**{region.replace('_', ' ').title()}**"):
+        for _, label, finding in case.findings:
+            with st.expander(f"**{label}**"):
                 st.write(finding)
     
     with tabs[4]:
@@ -541,17 +275,31 @@ def display_case(case: CXRCase):
         st.success(f"**{case.diagnosis}**")
         
         st.markdown("### Differential Diagnoses Considered")
-        for dx in case.differentials_considered:
-            st.markdown(f"- {dx}")
+        st.markdown(case_md["differentials"])
     
     with tabs[5]:
         st.markdown("### Teaching Points")
-        for i, point in enumerate(case.teaching_points, 1):
-            st.markdown(f"{i}. {point}")
+        st.markdown(case_md["teaching_points"])
         
         st.markdown("### References")
-        for ref in case.references:
-            st.caption(f"- {ref}")
+        st.caption(case_md["references"])
+
+
+@st.cache_data(show_spinner=False)
+def _case_markdown(case_id: str) -> Dict[str, str]:
+    """
+    Build the list sections of a case as single markdown blocks, so each
+    list is sent as one element instead of one element per item.
+    """
+    case = _build_case_library()[case_id]
+    return {
+        "key_findings": "\n".join(f"{i}. {finding}" 
+                                  for i, finding in enumerate(case.key_findings, 1)),
+        "differentials": "\n".join(f"- {dx}" for dx in case.differentials_considered),
+        "teaching_points": "\n".join(f"{i}. {point}" 
+                                     for i, point in enumerate(case.teaching_points, 1)),
+        "references": "\n".join(f"- {ref}" for ref in case.references)
+    }
 
 
 def create_custom_case():
@@ -595,18 +343,27 @@ def display_learning_progress():
     
     # Progress by category
     st.markdown("### Progress by Category")
-    categories = {
-        "Air Space Disease": 100,
-        "Interstitial Disease": 50,
-        "Nodules/Masses": 0,
-        "Pleural Disease": 100,
-        "Mediastinal": 0,
-        "Technical Quality": 100
-    }
-    
-    for cat, pct in categories.items():
+    for cat, pct in _progress_snapshot():
         st.progress(pct / 100, text=f"{cat}: {pct}%")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _progress_snapshot() -> Tuple[Tuple[str, int], ...]:
+    """
+    Per-category completion as (category, percent) pairs.
+    
+    Mock values for now; once real metrics are recorded, call
+    _progress_snapshot.clear() when an analysis is submitted.
+    """
+    return (
+        ("Air Space Disease", 100),
+        ("Interstitial Disease", 50),
+        ("Nodules/Masses", 0),
+        ("Pleural Disease", 100),
+        ("Mediastinal", 0),
+        ("Technical Quality", 100)
+    )
+
+
 # Export
 __all__ = ['interactive_case_study', 'CXRCase', 'CaseDifficulty']
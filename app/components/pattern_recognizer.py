@@ -1,155 +1,209 @@
 import streamlit as st
-import json
+from typing import Mapping, Tuple
+from dataclasses import dataclass
+
+# Divider and heading above each differential, sent with the body
+_DDX_HEADER_MD = "---\n### Differential Diagnosis\n"
+
+# ILO size codes offered for each small-opacity shape
+_SMALL_OPACITY_SIZES = {
+    "Round (nodular)": ("p (<1.5mm)", "q (1.5-3mm)", "r (3-10mm)"),
+    "Irregular (reticular)": ("s (<1.5mm)", "t (1.5-3mm)", "u (3-10mm)")
+}
+
+_DISTRIBUTION_ZONES = ("Upper zones", "Middle zones", "Lower zones",
+                       "Diffuse", "Perihilar", "Peripheral")
+
+# (zones, hint) rules; a hint shows when any of its zones is selected
+_DIST_HINTS = (
+    (frozenset({"Upper zones"}), "Upper zone predominance suggests: TB, sarcoidosis, pneumoconiosis, LCH"),
+    (frozenset({"Lower zones"}), "Lower zone predominance suggests: IPF, asbestosis, scleroderma, rheumatoid lung")
+)
+
+# Small-opacity differentials keyed by (shape, ILO size bucket)
+_SMALL_OPACITY_MD = {
+    ("round", "p"): """
+**Micronodular Pattern (<1.5mm):**
+- Alveolar microlithiasis
+- Intravenous talc granulomatosis
+- Early pneumoconiosis (silicosis, CWP)
+- Subacinar foci (PAP, PCP)
+""",
+    ("round", "qr"): """
+**Nodular Pattern (1.5-10mm):**
+- Miliary tuberculosis
+- Sarcoidosis
+- Fungal infections
+- Pneumoconiosis (silicosis, CWP)
+- Metastatic disease
+- Langerhans cell histiocytosis
+""",
+    ("irregular", "*"): """
+**Reticular Pattern:**
+- **Acute:** Interstitial edema, viral pneumonia, acute hypersensitivity
+- **Chronic:** IPF/UIP, NSIP, asbestosis, collagen vascular disease
+"""
+}
+
+# Consolidation pattern codes and their display labels
+_CONSOLIDATION_LABELS = {
+    "diffuse": "Diffuse homogeneous",
+    "patchy": "Multifocal patchy",
+    "lobar": "Lobar without atelectasis",
+    "lobar_atx": "Lobar with atelectasis",
+    "perihilar": "Perihilar (batwing/butterfly)",
+    "peripheral": "Peripheral"
+}
+
+_DIFFERENTIALS = {
+    "diffuse": ("Severe pneumonia", "ARDS", "Pulmonary edema", "Diffuse alveolar hemorrhage"),
+    "patchy": ("Bronchopneumonia", "Aspiration", "Organizing pneumonia", "Hemorrhage"),
+    "lobar": ("Lobar pneumonia", "Pulmonary infarction"),
+    "lobar_atx": ("Obstructive pneumonia", "Mucus plugging"),
+    "perihilar": ("Cardiogenic edema", "Alveolar proteinosis", "Pulmonary hemorrhage"),
+    "peripheral": ("Cryptogenic organizing pneumonia", "Chronic eosinophilic pneumonia", "COVID-19")
+}
+
+_LINE_DESCRIPTIONS = {
+    "Kerley A": "2-4cm lines radiating from hilum to upper lobes (axial interstitium)",
+    "Kerley B": "1cm lines at lung periphery, abutting pleura (subpleural interstitium)",
+    "Kerley C": "Fine reticular pattern (parenchymal interstitium)",
+    "Tram lines": "Parallel lines representing thickened bronchial walls"
+}
+
+_LINE_CAUSES_MD = {
+    "Kerley B": """
+**Causes of Kerley B lines:**
+- Chronic left ventricular failure
+- Mitral valve disease
+- Lymphangitic carcinomatosis
+- Asbestosis
+- Viral pneumonia (Hantavirus, coronavirus, measles)
+""",
+    "Tram lines": """
+**Causes of tram lines:**
+- Bronchiectasis
+- Chronic bronchitis
+- Asthma
+- ABPA (Allergic bronchopulmonary aspergillosis)
+"""
+}
+
+_DESTRUCTIVE_CAUSES_MD = """
+**Causes of Destructive Pattern:**
+- End-stage interstitial lung disease (IPF/UIP)
+- Advanced emphysema
+- Langerhans cell histiocytosis (end-stage)
+- Lymphangioleiomyomatosis
+- End-stage granulomatous disease
+"""
+
+_VASCULAR_EXPLANATIONS = {
+    "Cephalization (upper lobe diversion)": "Upper lobe vessels > lower lobe (LV failure, mitral stenosis, emphysema)",
+    "Equalization with hyperemia": "Similar size upper/lower vessels (L-R shunt, hyperthyroidism, anemia)",
+    "Equalization with oligemia": "Similar size but reduced (hypovolemia, R-L shunt)",
+    "Centralization (pruned tree)": "Large central, small peripheral (pulmonary hypertension)",
+    "Lateralization (asymmetric)": "One lung larger than other (unilateral emphysema, pulmonary artery obstruction)",
+    "Mosaic perfusion": "Patchy attenuation (emphysema, CTEPH, bronchiolitis obliterans)"
+}
+
+@dataclass(frozen=True, slots=True)
+class LookupPattern:
+    """A pattern rendered as: pick one option, show its explanation and any notes."""
+    title: str
+    prompt: str
+    explanations: Mapping[str, str]
+    notes: Mapping[str, str]
+
+_LINEAR_PATTERN = LookupPattern(
+    title="Linear Opacity Analysis",
+    prompt="Type:",
+    explanations=_LINE_DESCRIPTIONS,
+    notes=_LINE_CAUSES_MD
+)
+
+_VASCULAR_PATTERN = LookupPattern(
+    title="Vascular Pattern Analysis",
+    prompt="Vascular Pattern:",
+    explanations=_VASCULAR_EXPLANATIONS,
+    notes={}
+)
 
 def pattern_analysis():
-    st.markdown('<p class="section-header">🎯 Pattern Recognition & Differential Diagnosis</p>', 
-                unsafe_allow_html=True)
-    
-    with open('app/data/knowledge_base.json', 'r') as f:
-        kb = json.load(f)
+    st.header("🎯 Pattern Recognition & Differential Diagnosis")
     
     st.markdown("""
     **Approach:** Based on ILO classification and descriptive patterns 
     (Felson, McLoud, and Fleischner Society terminology)
     """)
     
-    pattern_type = st.selectbox(
-        "Select Pattern Type:",
-        ["Small Opacities (Nodular/Reticular)", "Large Opacities (Consolidation)",
-         "Linear Opacities", "Destructive Pattern", "Vascular Pattern"]
-    )
-    
-    if "Small Opacities" in pattern_type:
-        analyze_small_opacities(kb)
-    elif "Large Opacities" in pattern_type:
-        analyze_large_opacities(kb)
-    elif "Linear" in pattern_type:
-        analyze_linear_opacities(kb)
-    elif "Destructive" in pattern_type:
-        analyze_destructive_pattern(kb)
-    else:
-        analyze_vascular_pattern(kb)
+    pattern_type = st.selectbox("Select Pattern Type:", list(_PATTERN_DISPATCH))
+    
+    _PATTERN_DISPATCH[pattern_type]()
 
-def analyze_small_opacities(kb):
+@st.fragment
+def analyze_small_opacities():
     st.subheader("Small Opacity Analysis (ILO Classification)")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        shape = st.radio("Shape:", ["Round (nodular)", "Irregular (reticular)"])
-        if shape == "Round (nodular)":
-            size = st.selectbox("Size:", 
-                              ["p (<1.5mm)", "q (1.5-3mm)", "r (3-10mm)"])
-        else:
-            size = st.selectbox("Size:", 
-                              ["s (<1.5mm)", "t (1.5-3mm)", "u (3-10mm)"])
-    
-    with col2:
-        profusion = st.slider("Profusion (density):", 0, 3, 1)
-        distribution = st.multiselect("Distribution:", 
-                                    ["Upper zones", "Middle zones", "Lower zones",
-                                     "Diffuse", "Perihilar", "Peripheral"])
+    shape, size, profusion, distribution = _small_opacity_inputs()
     
     # Differential logic
-    st.markdown("---")
-    st.subheader("Differential Diagnosis")
-    
     if shape == "Round (nodular)":
-        if "p" in size:
-            st.markdown("""
-            **Micronodular Pattern (<1.5mm):**
-            - Alveolar microlithiasis
-            - Intravenous talc granulomatosis
-            - Early pneumoconiosis (silicosis, CWP)
-            - Subacinar foci (PAP, PCP)
-            """)
-        else:
-            st.markdown("""
-            **Nodular Pattern (1.5-10mm):**
-            - Miliary tuberculosis
-            - Sarcoidosis
-            - Fungal infections
-            - Pneumoconiosis (silicosis, CWP)
-            - Metastatic disease
-            - Langerhans cell histiocytosis
-            """)
+        key = ("round", "p" if size[0] == "p" else "qr")
     else:
-        st.markdown("""
-        **Reticular Pattern:**
-        - **Acute:** Interstitial edema, viral pneumonia, acute hypersensitivity
-        - **Chronic:** IPF/UIP, NSIP, asbestosis, collagen vascular disease
-        """)
+        key = ("irregular", "*")
+    ddx_md, hints = _small_opacity_ddx(key, tuple(sorted(distribution)))
+    st.markdown(_DDX_HEADER_MD + ddx_md)
     
     # Distribution-based refinement
-    if "Upper zones" in distribution:
-        st.info("Upper zone predominance suggests: TB, sarcoidosis, pneumoconiosis, LCH")
-    if "Lower zones" in distribution:
-        st.info("Lower zone predominance suggests: IPF, asbestosis, scleroderma, rheumatoid lung")
+    for hint in hints:
+        st.info(hint)
 
-def analyze_large_opacities(kb):
-    st.subheader("Large Opacity (Consolidation) Analysis")
+def _small_opacity_inputs() -> Tuple[str, str, int, Tuple[str, ...]]:
+    """Lay out the small-opacity widgets and return (shape, size, profusion, distribution)."""
+    col1, col2 = st.columns(2)
+    with col1:
+        shape = st.radio("Shape:", tuple(_SMALL_OPACITY_SIZES))
+        size = st.selectbox("Size:", _SMALL_OPACITY_SIZES[shape])
     
-    pattern = st.selectbox("Consolidation Pattern:", [
-        "Diffuse homogeneous",
-        "Multifocal patchy",
-        "Lobar without atelectasis",
-        "Lobar with atelectasis",
-        "Perihilar (batwing/butterfly)",
-        "Peripheral"
-    ])
+    with col2:
+        profusion = st.slider("Profusion (density):", 0, 3, 1)
+        distribution = st.multiselect("Distribution:", _DISTRIBUTION_ZONES)
     
-    air_bronchograms = st.checkbox("Air bronchograms present")
+    return shape, size, profusion, tuple(distribution)
+
+@st.cache_data(show_spinner=False)
+def _small_opacity_ddx(key: Tuple[str, str], 
+                       distribution: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Differential markdown and distribution hints for one set of small
+    opacity inputs. Pass distribution sorted so equal selections share
+    a cache entry.
+    """
+    dist = frozenset(distribution)
+    hints = tuple(hint for zones, hint in _DIST_HINTS if zones & dist)
+    return _SMALL_OPACITY_MD[key], hints
+
+@st.fragment
+def analyze_large_opacities():
+    st.subheader("Large Opacity (Consolidation) Analysis")
     
-    st.markdown("---")
-    st.subheader("Differential Diagnosis")
+    pattern = st.selectbox("Consolidation Pattern:", tuple(_CONSOLIDATION_LABELS),
+                           format_func=_CONSOLIDATION_LABELS.__getitem__)
     
-    differentials = {
-        "Diffuse homogeneous": ["Severe pneumonia", "ARDS", "Pulmonary edema", "Diffuse alveolar hemorrhage"],
-        "Multifocal patchy": ["Bronchopneumonia", "Aspiration", "Organizing pneumonia", "Hemorrhage"],
-        "Lobar without atelectasis": ["Lobar pneumonia", "Pulmonary infarction"],
-        "Lobar with atelectasis": ["Obstructive pneumonia", "Mucus plugging"],
-        "Perihilar (batwing/butterfly)": ["Cardiogenic edema", "Alveolar proteinosis", "Pulmonary hemorrhage"],
-        "Peripheral": ["Cryptogenic organizing pneumonia", "Chronic eosinophilic pneumonia", "COVID-19"]
-    }
+    air_bronchograms = st.checkbox("Air bronchograms present")
     
-    for dx in differentials.get(pattern, []):
-        st.markdown(f"- {dx}")
+    st.markdown(_DDX_HEADER_MD + "\n".join(f"- {dx}" for dx in _DIFFERENTIALS[pattern]))
     
     if air_bronchograms:
         st.success("Air bronchograms suggest: Air space disease (pneumonia, edema, hemorrhage)")
 
-def analyze_linear_opacities(kb):
-    st.subheader("Linear Opacity Analysis")
-    
-    line_type = st.selectbox("Type:", ["Kerley A", "Kerley B", "Kerley C", "Tram lines"])
-    
-    descriptions = {
-        "Kerley A": "2-4cm lines radiating from hilum to upper lobes (axial interstitium)",
-        "Kerley B": "1cm lines at lung periphery, abutting pleura (subpleural interstitium)",
-        "Kerley C": "Fine reticular pattern (parenchymal interstitium)",
-        "Tram lines": "Parallel lines representing thickened bronchial walls"
-    }
-    
-    st.info(descriptions[line_type])
-    
-    if line_type == "Kerley B":
-        st.markdown("""
-        **Causes of Kerley B lines:**
-        - Chronic left ventricular failure
-        - Mitral valve disease
-        - Lymphangitic carcinomatosis
-        - Asbestosis
-        - Viral pneumonia (Hantavirus, coronavirus, measles)
-        """)
-    elif line_type == "Tram lines":
-        st.markdown("""
-        **Causes of tram lines:**
-        - Bronchiectasis
-        - Chronic bronchitis
-        - Asthma
-        - ABPA (Allergic bronchopulmonary aspergillosis)
-        """)
-
-def analyze_destructive_pattern(kb):
+@st.fragment
+def analyze_linear_opacities():
+    render_lookup_pattern(_LINEAR_PATTERN)
+
+@st.fragment
+def analyze_destructive_pattern():
     st.subheader("Destructive Lung Disease")
     
     features = st.multiselect("Features present:", [
@@ -161,34 +215,28 @@ def analyze_destructive_pattern(kb):
         "Pulmonary hypertension"
     ])
     
-    st.markdown("""
-    **Causes of Destructive Pattern:**
-    - End-stage interstitial lung disease (IPF/UIP)
-    - Advanced emphysema
-    - Langerhans cell histiocytosis (end-stage)
-    - Lymphangioleiomyomatosis
-    - End-stage granulomatous disease
-    """)
+    st.markdown(_DESTRUCTIVE_CAUSES_MD)
+
+@st.fragment
+def analyze_vascular_pattern():
+    render_lookup_pattern(_VASCULAR_PATTERN)
 
-def analyze_vascular_pattern(kb):
-    st.subheader("Vascular Pattern Analysis")
+def render_lookup_pattern(spec: LookupPattern):
+    st.subheader(spec.title)
     
-    pattern = st.selectbox("Vascular Pattern:", [
-        "Cephalization (upper lobe diversion)",
-        "Equalization with hyperemia",
-        "Equalization with oligemia",
-        "Centralization (pruned tree)",
-        "Lateralization (asymmetric)",
-        "Mosaic perfusion"
-    ])
+    choice = st.selectbox(spec.prompt, tuple(spec.explanations))
     
-    explanations = {
-        "Cephalization": "Upper lobe vessels > lower lobe (LV failure, mitral stenosis, emphysema)",
-        "Equalization with hyperemia": "Similar size upper/lower vessels (L-R shunt, hyperthyroidism, anemia)",
-        "Equalization with oligemia": "Similar size but reduced (hypovolemia, R-L shunt)",
-        "Centralization": "Large central, small peripheral (pulmonary hypertension)",
-        "Lateralization": "One lung larger than other (unilateral emphysema, pulmonary artery obstruction)",
-        "Mosaic perfusion": "Patchy attenuation (emphysema, CTEPH, bronchiolitis obliterans)"
-    }
+    st.info(spec.explanations[choice])
     
-    st.info(explanations[pattern])
+    notes_md = spec.notes.get(choice)
+    if notes_md:
+        st.markdown(notes_md)
+
+# Selectbox label -> analyzer; the keys double as the selectbox options
+_PATTERN_DISPATCH = {
+    "Small Opacities (Nodular/Reticular)": analyze_small_opacities,
+    "Large Opacities (Consolidation)": analyze_large_opacities,
+    "Linear Opacities": analyze_linear_opacities,
+    "Destructive Pattern": analyze_destructive_pattern,
+    "Vascular Pattern": analyze_vascular_pattern
+}
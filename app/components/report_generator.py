@@ -2,8 +2,7 @@ import streamlit as st
 from datetime import datetime
 
 def generate_structured_report():
-    st.markdown('<p class="section-header">📄 Structured Report Generator</p>', 
-                unsafe_allow_html=True)
+    st.header("📄 Structured Report Generator")
     
     st.markdown("""
     Generate a structured radiology report following the systematic approach.
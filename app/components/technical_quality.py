@@ -12,30 +12,272 @@ Evaluates five main technical factors:
 """
 
 import streamlit as st
-from typing import Dict, List, Tuple, Optional
-import json
+from bisect import bisect_right
+from itertools import product
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 
-class PositionQuality(Enum):
-    """Positioning quality ratings"""
-    OPTIMAL = "optimal"
-    ACCEPTABLE = "acceptable" 
-    SUBOPTIMAL = "suboptimal"
-    NON_DIAGNOSTIC = "non_diagnostic"
+# Static guidance text
+_REFERENCE_INFO_MD = """
+**Reference:** Klein JS, Guilleman RP. Systematic Approach to Chest Radiographic Analysis.
 
+Technical adequacy must be confirmed before interpretation to avoid:
+- **Overdiagnosis** (low lung volume may simulate lung disease)
+- **Underdiagnosis** (motion or rotation may limit evaluation)
+"""
+
+_POSITIONING_CRITERIA_MD = """
+**Optimal Positioning Criteria:**
+1. **Rotation:** Spinous processes midway between clavicular heads
+2. **Scapulae:** Rotated laterally, clear of lung fields
+3. **Clavicles:** Symmetric, equal distance from spine
+"""
+
+_POSITIONING_TIP_MD = """
+**Tip:** On proper PA film:
+- Medial clavicle ends equidistant from spinous process
+- Scapular shadows lateral to lung apices
+"""
+
+_PENETRATION_CRITERIA_MD = """
+**Optimal Penetration Criteria:**
+- **Mediastinum:** Vertebral bodies faintly visible through heart shadow
+- **Lung Fields:** Gray density (not black/white)
+- **Vessels:** Pulmonary vessels easily distinguished
+"""
+
+_PENETRATION_IMPACT_MD = """
+**Clinical Impact:**
+- **Under-penetrated:** May miss lung nodules, vascular markings obscured
+- **Over-penetrated:** Mediastinal details lost, may miss subtle infiltrates
+"""
+
+_MOTION_CRITERIA_MD = """
+**Motion Detection:**
+Motion degrades image quality by blurring structures. Check:
+1. **Rib cortices:** Should be sharp, well-defined
+2. **Vessel margins:** Should be crisp
+3. **Diaphragm:** Contours should be distinct
+"""
+
+_INSPIRATION_CRITERIA_MD = """
+**Optimal Inspiration Criteria:**
+- **Right hemidiaphragm:** At level of 6th anterior rib OR 10th posterior rib
+- **Measurement point:** Mid-clavicular line
+- **Posterior ribs:** Minimum 8-9 visible above diaphragm
+"""
+
+_INSPIRATION_IMPACT_MD = """
+**Clinical Impact:**
+- **Poor inspiration:** Crowds vessels, mimics cardiomegaly, obscures bases
+- **Hyperinflation:** Suggests COPD/asthma
+"""
+
+_ARTIFACT_TYPES_MD = """
+**Digital Radiography Artifacts:**
+- Grid lines (improper grid technique)
+- Detector faults (dead pixels, lines)
+- Processing artifacts (edge enhancement, noise)
+- Foreign objects (clothing, jewelry, monitoring equipment)
+"""
+
+
+# Positioning radio options and the score (0-3) of each, index-aligned.
+# None means the option is left out of the average: the optimal scapulae and
+# clavicle labels carry no rating keyword, and the original scorer skipped them
+_ROTATION_OPTIONS = (
+    "Midway between clavicles (no rotation)",
+    "Slightly off-center (<1cm deviation)",
+    "Obviously rotated (>1cm deviation)",
+    "Severely rotated (non-diagnostic)"
+)
+_ROTATION_SCORES = (3, 2, 1, 0)
+
+_SCAPULAE_OPTIONS = (
+    "Rotated laterally, clear of lungs",
+    "Partially overlapping upper lungs",
+    "Heavily superimposed on lung fields"
+)
+_SCAPULAE_SCORES = (None, 1, 0)
+
+_CLAVICLE_OPTIONS = (
+    "Symmetric, equal distance from spine",
+    "Slightly asymmetric",
+    "Markedly asymmetric"
+)
+_CLAVICLE_SCORES = (None, 2, 1)
+
+
+# Motion radio options, ordered sharp -> severely blurred; the index is the blur grade
+_RIB_OPTIONS = (
+    "Sharp and well-defined",
+    "Slightly blurred",
+    "Moderately blurred",
+    "Severely blurred"
+)
+
+_VESSEL_MARGIN_OPTIONS = (
+    "Sharp and distinct",
+    "Slightly indistinct",
+    "Blurred",
+    "Severely blurred"
+)
+
+_DIAPHRAGM_CONTOUR_OPTIONS = (
+    "Sharp and distinct",
+    "Slightly blurred",
+    "Moderately blurred",
+    "Severely blurred/indistinct"
+)
+
+_HEART_BORDER_OPTIONS = (
+    "Sharp and distinct",
+    "Slightly blurred",
+    "Blurred",
+    "Severely blurred"
+)
+
+_SEVERE_BLUR = 3
+
+# Penetration radio options
+_PEN_MEDIASTINUM_OPTIONS = (
+    "Faintly visible through mediastinum (optimal)",
+    "Clearly visible (over-penetrated)",
+    "Not visible (under-penetrated)",
+    "Barely visible (slightly under-penetrated)"
+)
+
+_LUNG_DENSITY_OPTIONS = (
+    "Gray (optimal)",
+    "Black (over-penetrated)",
+    "White (under-penetrated)",
+    "Patchy (inconsistent)"
+)
+
+_VESSEL_VISIBILITY_OPTIONS = (
+    "Easily seen throughout lungs",
+    "Too prominent (over-penetrated)",
+    "Obscured (under-penetrated)",
+    "Poorly visualized"
+)
+
+# Inspiration options
+_ANTERIOR_RIB_OPTIONS = ("4th", "5th", "6th (optimal)", "7th", "8th or below")
+
+_DIAPHRAGM_POSITION_OPTIONS = (
+    "Normal (6th anterior/10th posterior)",
+    "Elevated (poor inspiration)",
+    "Lowered (hyperinflation)",
+    "Asymmetric (pathology)"
+)
+
+# Artifact severity, mildest first; the last two affect diagnosis
+_ARTIFACT_SEVERITY_OPTIONS = (
+    "Minimal (no impact)",
+    "Mild (minor impact)",
+    "Moderate (significant impact)",
+    "Severe (non-diagnostic)"
+)
+_DIAGNOSTIC_SEVERITIES = _ARTIFACT_SEVERITY_OPTIONS[2:]
 
-@dataclass
+# Overall quality tiers: an average score at or above _TIER_THRESHOLDS[i]
+# falls into _QUALITY_TIERS[i + 1]
+_TIER_THRESHOLDS = (1.2, 1.8, 2.5)
+_QUALITY_TIERS = (
+    "NON-DIAGNOSTIC - Repeat recommended",
+    "SUBOPTIMAL - Interpret with caution",
+    "ACCEPTABLE",
+    "OPTIMAL"
+)
+
+
+class PositionQuality(IntEnum):
+    """Positioning quality ratings, valued by score (higher is better)"""
+    OPTIMAL = 3
+    ACCEPTABLE = 2
+    SUBOPTIMAL = 1
+    NON_DIAGNOSTIC = 0
+    
+    @property
+    def label(self) -> str:
+        """Lower-case name used in the summary and report text"""
+        return self.name.lower()
+
+
+@dataclass(frozen=True, slots=True)
+class PositioningResult:
+    """Positioning assessment: selected options and derived quality"""
+    rotation: str
+    scapulae: str
+    clavicles: str
+    quality_score: PositionQuality
+    findings: str
+    is_diagnostic: bool
+
+
+@dataclass(frozen=True, slots=True)
+class PenetrationResult:
+    """Penetration assessment: selected options, quality and issues"""
+    mediastinum: str
+    lung_density: str
+    vessels: str
+    quality: str
+    issues: Tuple[str, ...]
+    findings: str
+
+
+@dataclass(frozen=True, slots=True)
+class MotionResult:
+    """Motion assessment: sharpness of each structure and derived quality"""
+    ribs: str
+    vessels: str
+    diaphragm: str
+    heart: str
+    quality: str
+    is_diagnostic: bool
+    findings: str
+
+
+@dataclass(frozen=True, slots=True)
+class InspirationResult:
+    """Inspiration assessment: diaphragm level, rib count and derived quality"""
+    anterior_rib: str
+    posterior_rib_count: int
+    diaphragm_position: str
+    quality: str
+    is_adequate: bool
+    findings: str
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactResult:
+    """Artifact assessment: flags for each artifact type and overall severity"""
+    grid_lines: bool
+    detector_faults: bool
+    processing: bool
+    clothing: bool
+    jewelry: bool
+    medical: bool
+    noise: bool
+    saturation: bool
+    stitching: bool
+    severity: str
+    affects_diagnosis: bool
+    findings: str
+
+
+@dataclass(frozen=True, slots=True)
 class TechnicalAssessment:
     """Data class to store technical quality assessment results"""
-    positioning: Dict
-    penetration: Dict
-    motion: Dict
-    inspiration: Dict
-    artifacts: Dict
+    positioning: PositioningResult
+    penetration: PenetrationResult
+    motion: MotionResult
+    inspiration: InspirationResult
+    artifacts: ArtifactResult
     overall_quality: str
-    recommendations: List[str]
+    recommendations: Tuple[str, ...]
 
 
 def technical_quality_assessor():
@@ -43,16 +285,9 @@ def technical_quality_assessor():
     Main function for technical quality assessment module.
     Provides interactive checklist and assessment tools.
     """
-    st.markdown('<p class="section-header">📋 Technical Quality Assessment</p>', 
-                unsafe_allow_html=True)
+    st.header("📋 Technical Quality Assessment")
     
-    st.info("""
-    **Reference:** Klein JS, Guilleman RP. Systematic Approach to Chest Radiographic Analysis.
-    
-    Technical adequacy must be confirmed before interpretation to avoid:
-    - **Overdiagnosis** (low lung volume may simulate lung disease)
-    - **Underdiagnosis** (motion or rotation may limit evaluation)
-    """)
+    st.info(_REFERENCE_INFO_MD)
     
     # Create tabs for organized assessment
     tabs = st.tabs([
@@ -64,35 +299,27 @@ def technical_quality_assessor():
         "📊 Summary"
     ])
     
-    # Initialize session state for storing assessments
+    # Initialize session state once with every component unassessed (None)
     if 'tech_assessment' not in st.session_state:
-        st.session_state.tech_assessment = {}
-    
-    with tabs[0]:
-        positioning_assessment = assess_positioning()
-        st.session_state.tech_assessment['positioning'] = positioning_assessment
-    
-    with tabs[1]:
-        penetration_assessment = assess_penetration()
-        st.session_state.tech_assessment['penetration'] = penetration_assessment
-    
-    with tabs[2]:
-        motion_assessment = assess_motion()
-        st.session_state.tech_assessment['motion'] = motion_assessment
-    
-    with tabs[3]:
-        inspiration_assessment = assess_inspiration()
-        st.session_state.tech_assessment['inspiration'] = inspiration_assessment
-    
-    with tabs[4]:
-        artifacts_assessment = assess_artifacts()
-        st.session_state.tech_assessment['artifacts'] = artifacts_assessment
+        st.session_state.tech_assessment = dict.fromkeys(key for key, _ in _ASSESSMENT_TABS)
+    assessment = st.session_state.tech_assessment
+    
+    # Each tab is a form, so answering questions does not rerun the app;
+    # a component is recorded only when its form is saved
+    for tab, (key, assess) in zip(tabs, _ASSESSMENT_TABS):
+        with tab:
+            with st.form(f"form_tq_{key}", clear_on_submit=False):
+                result = assess()
+                submitted = st.form_submit_button("Save Assessment")
+            
+            if submitted:
+                assessment[key] = result
     
     with tabs[5]:
-        display_summary(st.session_state.tech_assessment)
+        display_summary(assessment)
 
 
-def assess_positioning() -> Dict:
+def assess_positioning() -> PositioningResult:
     """
     Assess patient positioning and rotation.
     
@@ -103,12 +330,7 @@ def assess_positioning() -> Dict:
     """
     st.subheader("Patient Positioning Assessment")
     
-    st.markdown("""
-    **Optimal Positioning Criteria:**
-    1. **Rotation:** Spinous processes midway between clavicular heads
-    2. **Scapulae:** Rotated laterally, clear of lung fields
-    3. **Clavicles:** Symmetric, equal distance from spine
-    """)
+    st.markdown(_POSITIONING_CRITERIA_MD)
     
     col1, col2 = st.columns(2)
     
@@ -116,23 +338,16 @@ def assess_positioning() -> Dict:
         st.markdown("**Rotation Check**")
         rotation = st.radio(
             "Spinous process position:",
-            [
-                "Midway between clavicles (no rotation)",
-                "Slightly off-center (<1cm deviation)",
-                "Obviously rotated (>1cm deviation)",
-                "Severely rotated (non-diagnostic)"
-            ],
+            range(len(_ROTATION_OPTIONS)),
+            format_func=_ROTATION_OPTIONS.__getitem__,
             key="pos_rotation"
         )
         
         st.markdown("**Scapular Position**")
         scapulae = st.radio(
             "Scapulae position:",
-            [
-                "Rotated laterally, clear of lungs",
-                "Partially overlapping upper lungs",
-                "Heavily superimposed on lung fields"
-            ],
+            range(len(_SCAPULAE_OPTIONS)),
+            format_func=_SCAPULAE_OPTIONS.__getitem__,
             key="pos_scapulae"
         )
     
@@ -140,20 +355,13 @@ def assess_positioning() -> Dict:
         st.markdown("**Clavicular Symmetry**")
         clavicles = st.radio(
             "Clavicle symmetry:",
-            [
-                "Symmetric, equal distance from spine",
-                "Slightly asymmetric",
-                "Markedly asymmetric"
-            ],
+            range(len(_CLAVICLE_OPTIONS)),
+            format_func=_CLAVICLE_OPTIONS.__getitem__,
             key="pos_clavicles"
         )
         
         # Visual guide
-        st.info("""
-        **Tip:** On proper PA film:
-        - Medial clavicle ends equidistant from spinous process
-        - Scapular shadows lateral to lung apices
-        """)
+        st.info(_POSITIONING_TIP_MD)
     
     # Calculate positioning quality
     quality_score = calculate_positioning_quality(rotation, scapulae, clavicles)
@@ -165,38 +373,25 @@ def assess_positioning() -> Dict:
         key="pos_findings"
     )
     
-    return {
-        'rotation': rotation,
-        'scapulae': scapulae,
-        'clavicles': clavicles,
-        'quality_score': quality_score,
-        'findings': findings,
-        'is_diagnostic': quality_score != PositionQuality.NON_DIAGNOSTIC
-    }
+    return PositioningResult(
+        rotation=_ROTATION_OPTIONS[rotation],
+        scapulae=_SCAPULAE_OPTIONS[scapulae],
+        clavicles=_CLAVICLE_OPTIONS[clavicles],
+        quality_score=quality_score,
+        findings=findings,
+        is_diagnostic=quality_score != PositionQuality.NON_DIAGNOSTIC
+    )
 
 
-def calculate_positioning_quality(rotation: str, scapulae: str, clavicles: str) -> PositionQuality:
-    """Calculate overall positioning quality based on individual factors."""
-    
-    # Define quality levels
-    quality_map = {
-        "no rotation": 3, "Midway": 3,
-        "<1cm": 2, "Slightly": 2,
-        ">1cm": 1, "Obviously": 1, "Partially": 1, "asymmetric": 1,
-        "Severely": 0, "Heavily": 0, "Markedly": 0, "non-diagnostic": 0
-    }
-    
-    score = 0
-    total = 0
-    
-    for text in [rotation, scapulae, clavicles]:
-        for key, value in quality_map.items():
-            if key in text:
-                score += value
-                total += 3
-                break
-    
-    avg_score = score / total if total > 0 else 0
+def calculate_positioning_quality(rotation: int, scapulae: int, clavicles: int) -> PositionQuality:
+    """Calculate overall positioning quality from the selected option indices."""
+    return _POSITIONING_TIERS[rotation, scapulae, clavicles]
+
+
+def _positioning_tier(scores: Tuple[Optional[int], ...]) -> PositionQuality:
+    """Rate positioning from the component scores, skipping unscored (None) ones."""
+    scored = [score for score in scores if score is not None]
+    avg_score = sum(scored) / (3 * len(scored)) if scored else 0
     
     if avg_score >= 0.9:
         return PositionQuality.OPTIMAL
@@ -208,7 +403,16 @@ def calculate_positioning_quality(rotation: str, scapulae: str, clavicles: str)
         return PositionQuality.NON_DIAGNOSTIC
 
 
-def assess_penetration() -> Dict:
+# Every (rotation, scapulae, clavicles) answer combination rated once at import
+_POSITIONING_TIERS = {
+    (r, s, c): _positioning_tier((_ROTATION_SCORES[r], _SCAPULAE_SCORES[s], _CLAVICLE_SCORES[c]))
+    for r, s, c in product(range(len(_ROTATION_SCORES)),
+                           range(len(_SCAPULAE_SCORES)),
+                           range(len(_CLAVICLE_SCORES)))
+}
+
+
+def assess_penetration() -> PenetrationResult:
     """
     Assess radiographic penetration.
     
@@ -219,12 +423,7 @@ def assess_penetration() -> Dict:
     """
     st.subheader("Radiographic Penetration Assessment")
     
-    st.markdown("""
-    **Optimal Penetration Criteria:**
-    - **Mediastinum:** Vertebral bodies faintly visible through heart shadow
-    - **Lung Fields:** Gray density (not black/white)
-    - **Vessels:** Pulmonary vessels easily distinguished
-    """)
+    st.markdown(_PENETRATION_CRITERIA_MD)
     
     col1, col2 = st.columns(2)
     
@@ -232,24 +431,14 @@ def assess_penetration() -> Dict:
         st.markdown("**Mediastinal Penetration**")
         mediastinum = st.radio(
             "Vertebral body visualization:",
-            [
-                "Faintly visible through mediastinum (optimal)",
-                "Clearly visible (over-penetrated)",
-                "Not visible (under-penetrated)",
-                "Barely visible (slightly under-penetrated)"
-            ],
+            _PEN_MEDIASTINUM_OPTIONS,
             key="pen_mediastinum"
         )
         
         st.markdown("**Lung Density**")
         lung_density = st.radio(
             "Lung field density:",
-            [
-                "Gray (optimal)",
-                "Black (over-penetrated)",
-                "White (under-penetrated)",
-                "Patchy (inconsistent)"
-            ],
+            _LUNG_DENSITY_OPTIONS,
             key="pen_lungs"
         )
     
@@ -257,32 +446,15 @@ def assess_penetration() -> Dict:
         st.markdown("**Vascular Markings**")
         vessels = st.radio(
             "Pulmonary vessel visibility:",
-            [
-                "Easily seen throughout lungs",
-                "Too prominent (over-penetrated)",
-                "Obscured (under-penetrated)",
-                "Poorly visualized"
-            ],
+            _VESSEL_VISIBILITY_OPTIONS,
             key="pen_vessels"
         )
         
         # Penetration guide
-        st.warning("""
-        **Clinical Impact:**
-        - **Under-penetrated:** May miss lung nodules, vascular markings obscured
-        - **Over-penetrated:** Mediastinal details lost, may miss subtle infiltrates
-        """)
+        st.warning(_PENETRATION_IMPACT_MD)
     
     # Determine penetration quality
-    penetration_quality = "optimal"
-    issues = []
-    
-    if "over-penetrated" in mediastinum or "Black" in lung_density:
-        penetration_quality = "over_penetrated"
-        issues.append("Over-penetration may obscure mediastinal abnormalities")
-    elif "under-penetrated" in mediastinum or "White" in lung_density:
-        penetration_quality = "under_penetrated"
-        issues.append("Under-penetration may obscure lung parenchymal details")
+    penetration_quality, issues = calculate_penetration_quality(mediastinum, lung_density)
     
     findings = st.text_area(
         "Penetration Findings:",
@@ -290,17 +462,26 @@ def assess_penetration() -> Dict:
         key="pen_findings"
     )
     
-    return {
-        'mediastinum': mediastinum,
-        'lung_density': lung_density,
-        'vessels': vessels,
-        'quality': penetration_quality,
-        'issues': issues,
-        'findings': findings
-    }
+    return PenetrationResult(
+        mediastinum=mediastinum,
+        lung_density=lung_density,
+        vessels=vessels,
+        quality=penetration_quality,
+        issues=issues,
+        findings=findings
+    )
 
 
-def assess_motion() -> Dict:
+def calculate_penetration_quality(mediastinum: str, lung_density: str) -> Tuple[str, Tuple[str, ...]]:
+    """Classify penetration from the mediastinal and lung density findings."""
+    if "over-penetrated" in mediastinum or "Black" in lung_density:
+        return "over_penetrated", ("Over-penetration may obscure mediastinal abnormalities",)
+    if "under-penetrated" in mediastinum or "White" in lung_density:
+        return "under_penetrated", ("Under-penetration may obscure lung parenchymal details",)
+    return "optimal", ()
+
+
+def assess_motion() -> MotionResult:
     """
     Assess for motion artifact.
     
@@ -311,13 +492,7 @@ def assess_motion() -> Dict:
     """
     st.subheader("Motion Artifact Assessment")
     
-    st.markdown("""
-    **Motion Detection:**
-    Motion degrades image quality by blurring structures. Check:
-    1. **Rib cortices:** Should be sharp, well-defined
-    2. **Vessel margins:** Should be crisp
-    3. **Diaphragm:** Contours should be distinct
-    """)
+    st.markdown(_MOTION_CRITERIA_MD)
     
     col1, col2 = st.columns(2)
     
@@ -325,24 +500,16 @@ def assess_motion() -> Dict:
         st.markdown("**Rib Sharpness**")
         ribs = st.radio(
             "Rib cortices:",
-            [
-                "Sharp and well-defined",
-                "Slightly blurred",
-                "Moderately blurred",
-                "Severely blurred"
-            ],
+            range(len(_RIB_OPTIONS)),
+            format_func=_RIB_OPTIONS.__getitem__,
             key="mot_ribs"
         )
         
         st.markdown("**Vessel Margins**")
         vessels = st.radio(
             "Pulmonary vessel margins:",
-            [
-                "Sharp and distinct",
-                "Slightly indistinct",
-                "Blurred",
-                "Severely blurred"
-            ],
+            range(len(_VESSEL_MARGIN_OPTIONS)),
+            format_func=_VESSEL_MARGIN_OPTIONS.__getitem__,
             key="mot_vessels"
         )
     
@@ -350,44 +517,21 @@ def assess_motion() -> Dict:
         st.markdown("**Diaphragm Contours**")
         diaphragm = st.radio(
             "Diaphragmatic contours:",
-            [
-                "Sharp and distinct",
-                "Slightly blurred",
-                "Moderately blurred",
-                "Severely blurred/indistinct"
-            ],
+            range(len(_DIAPHRAGM_CONTOUR_OPTIONS)),
+            format_func=_DIAPHRAGM_CONTOUR_OPTIONS.__getitem__,
             key="mot_diaphragm"
         )
         
         st.markdown("**Heart Borders**")
         heart = st.radio(
             "Cardiac borders:",
-            [
-                "Sharp and distinct",
-                "Slightly blurred",
-                "Blurred",
-                "Severely blurred"
-            ],
+            range(len(_HEART_BORDER_OPTIONS)),
+            format_func=_HEART_BORDER_OPTIONS.__getitem__,
             key="mot_heart"
         )
     
     # Calculate motion score
-    motion_items = [ribs, vessels, diaphragm, heart]
-    blur_count = sum(1 for item in motion_items if "blurred" in item)
-    severe_count = sum(1 for item in motion_items if "Severely" in item)
-    
-    if severe_count >= 2:
-        motion_quality = "severe_motion"
-        diagnostic = False
-    elif blur_count >= 3:
-        motion_quality = "moderate_motion"
-        diagnostic = False
-    elif blur_count >= 1:
-        motion_quality = "mild_motion"
-        diagnostic = True
-    else:
-        motion_quality = "no_motion"
-        diagnostic = True
+    motion_quality, diagnostic = calculate_motion_quality((ribs, vessels, diaphragm, heart))
     
     if not diagnostic:
         st.error("⚠️ **Significant motion artifact - Image may be non-diagnostic**")
@@ -398,18 +542,32 @@ def assess_motion() -> Dict:
         key="mot_findings"
     )
     
-    return {
-        'ribs': ribs,
-        'vessels': vessels,
-        'diaphragm': diaphragm,
-        'heart': heart,
-        'quality': motion_quality,
-        'is_diagnostic': diagnostic,
-        'findings': findings
-    }
+    return MotionResult(
+        ribs=_RIB_OPTIONS[ribs],
+        vessels=_VESSEL_MARGIN_OPTIONS[vessels],
+        diaphragm=_DIAPHRAGM_CONTOUR_OPTIONS[diaphragm],
+        heart=_HEART_BORDER_OPTIONS[heart],
+        quality=motion_quality,
+        is_diagnostic=diagnostic,
+        findings=findings
+    )
+
+
+def calculate_motion_quality(motion_items: Tuple[int, ...]) -> Tuple[str, bool]:
+    """Grade motion from the blur grades (option indices); returns (quality, is_diagnostic)."""
+    blur_count = sum(grade > 0 for grade in motion_items)
+    severe_count = sum(grade == _SEVERE_BLUR for grade in motion_items)
+    
+    if severe_count >= 2:
+        return "severe_motion", False
+    if blur_count >= 3:
+        return "moderate_motion", False
+    if blur_count >= 1:
+        return "mild_motion", True
+    return "no_motion", True
 
 
-def assess_inspiration() -> Dict:
+def assess_inspiration() -> InspirationResult:
     """
     Assess adequacy of inspiration.
     
@@ -420,12 +578,7 @@ def assess_inspiration() -> Dict:
     """
     st.subheader("Inspiratory Effort Assessment")
     
-    st.markdown("""
-    **Optimal Inspiration Criteria:**
-    - **Right hemidiaphragm:** At level of 6th anterior rib OR 10th posterior rib
-    - **Measurement point:** Mid-clavicular line
-    - **Posterior ribs:** Minimum 8-9 visible above diaphragm
-    """)
+    st.markdown(_INSPIRATION_CRITERIA_MD)
     
     col1, col2 = st.columns(2)
     
@@ -433,7 +586,7 @@ def assess_inspiration() -> Dict:
         st.markdown("**Anterior Rib Count**")
         anterior_rib = st.selectbox(
             "Right hemidiaphragm level (anterior ribs):",
-            ["4th", "5th", "6th (optimal)", "7th", "8th or below"],
+            _ANTERIOR_RIB_OPTIONS,
             key="insp_anterior"
         )
         
@@ -450,32 +603,15 @@ def assess_inspiration() -> Dict:
         st.markdown("**Hemidiaphragm Position**")
         diaphragm_pos = st.radio(
             "Hemidiaphragm position:",
-            [
-                "Normal (6th anterior/10th posterior)",
-                "Elevated (poor inspiration)",
-                "Lowered (hyperinflation)",
-                "Asymmetric (pathology)"
-            ],
+            _DIAPHRAGM_POSITION_OPTIONS,
             key="insp_diaphragm"
         )
         
         # Clinical correlation
-        st.info("""
-        **Clinical Impact:**
-        - **Poor inspiration:** Crowds vessels, mimics cardiomegaly, obscures bases
-        - **Hyperinflation:** Suggests COPD/asthma
-        """)
+        st.info(_INSPIRATION_IMPACT_MD)
     
     # Assess inspiration quality
-    rib_count_ok = posterior_ribs >= 8
-    position_ok = "optimal" in anterior_rib or "Normal" in diaphragm_pos
-    
-    if position_ok and rib_count_ok:
-        inspiration_quality = "adequate"
-    elif posterior_ribs >= 7:
-        inspiration_quality = "suboptimal"
-    else:
-        inspiration_quality = "poor"
+    inspiration_quality = calculate_inspiration_quality(anterior_rib, posterior_ribs, diaphragm_pos)
     
     if "poor" in inspiration_quality:
         st.warning("⚠️ Poor inspiration may simulate lung disease or cardiomegaly")
@@ -486,17 +622,29 @@ def assess_inspiration() -> Dict:
         key="insp_findings"
     )
     
-    return {
-        'anterior_rib': anterior_rib,
-        'posterior_rib_count': posterior_ribs,
-        'diaphragm_position': diaphragm_pos,
-        'quality': inspiration_quality,
-        'is_adequate': inspiration_quality == "adequate",
-        'findings': findings
-    }
+    return InspirationResult(
+        anterior_rib=anterior_rib,
+        posterior_rib_count=posterior_ribs,
+        diaphragm_position=diaphragm_pos,
+        quality=inspiration_quality,
+        is_adequate=inspiration_quality == "adequate",
+        findings=findings
+    )
+
+
+def calculate_inspiration_quality(anterior_rib: str, posterior_ribs: int, diaphragm_pos: str) -> str:
+    """Grade inspiratory effort from diaphragm level and posterior rib count."""
+    rib_count_ok = posterior_ribs >= 8
+    position_ok = "optimal" in anterior_rib or "Normal" in diaphragm_pos
+    
+    if position_ok and rib_count_ok:
+        return "adequate"
+    if posterior_ribs >= 7:
+        return "suboptimal"
+    return "poor"
 
 
-def assess_artifacts() -> Dict:
+def assess_artifacts() -> ArtifactResult:
     """
     Assess for artifacts in digital radiography.
     
@@ -509,13 +657,7 @@ def assess_artifacts() -> Dict:
     """
     st.subheader("Artifact Assessment")
     
-    st.markdown("""
-    **Digital Radiography Artifacts:**
-    - Grid lines (improper grid technique)
-    - Detector faults (dead pixels, lines)
-    - Processing artifacts (edge enhancement, noise)
-    - Foreign objects (clothing, jewelry, monitoring equipment)
-    """)
+    st.markdown(_ARTIFACT_TYPES_MD)
     
     col1, col2 = st.columns(2)
     
@@ -536,18 +678,20 @@ def assess_artifacts() -> Dict:
         saturation = st.checkbox("Saturation (too bright/dark areas)", key="art_saturation")
         stitching = st.checkbox("Stitching artifacts (if composite)", key="art_stitch")
         
-        # Artifact severity
-        if any([grid_lines, detector_faults, processing, noise, saturation]):
-            severity = st.radio(
-                "Artifact severity:",
-                ["Minimal (no impact)", "Mild (minor impact)", 
-                 "Moderate (significant impact)", "Severe (non-diagnostic)"]
-            )
+        # Artifact severity; forms cannot show/hide inputs before submit, so
+        # it is always shown and only applies when an artifact is ticked
+        selected_severity = st.radio(
+            "Artifact severity (if artifacts present):",
+            _ARTIFACT_SEVERITY_OPTIONS,
+            key="art_severity"
+        )
+        if grid_lines or detector_faults or processing or noise or saturation:
+            severity = selected_severity
         else:
             severity = "None"
     
     # Determine if artifacts affect diagnosis
-    diagnostic_impact = severity in ["Moderate (significant impact)", "Severe (non-diagnostic)"]
+    diagnostic_impact = severity in _DIAGNOSTIC_SEVERITIES
     
     findings = st.text_area(
         "Artifact Description:",
@@ -555,24 +699,30 @@ def assess_artifacts() -> Dict:
         key="art_findings"
     )
     
-    return {
-        'grid_lines': grid_lines,
-        'detector_faults': detector_faults,
-        'processing': processing,
-        'foreign_objects': {
-            'clothing': clothing,
-            'jewelry': jewelry,
-            'medical': medical
-        },
-        'quality_issues': {
-            'noise': noise,
-            'saturation': saturation,
-            'stitching': stitching
-        },
-        'severity': severity,
-        'affects_diagnosis': diagnostic_impact,
-        'findings': findings
-    }
+    return ArtifactResult(
+        grid_lines=grid_lines,
+        detector_faults=detector_faults,
+        processing=processing,
+        clothing=clothing,
+        jewelry=jewelry,
+        medical=medical,
+        noise=noise,
+        saturation=saturation,
+        stitching=stitching,
+        severity=severity,
+        affects_diagnosis=diagnostic_impact,
+        findings=findings
+    )
+
+
+# (assessment key, assessor) for each form tab, in tab order
+_ASSESSMENT_TABS = (
+    ('positioning', assess_positioning),
+    ('penetration', assess_penetration),
+    ('motion', assess_motion),
+    ('inspiration', assess_inspiration),
+    ('artifacts', assess_artifacts)
+)
 
 
 def display_summary(assessment: Dict):
@@ -581,107 +731,39 @@ def display_summary(assessment: Dict):
     """
     st.subheader("Technical Quality Summary")
     
-    # Calculate overall quality
-    quality_scores = []
-    diagnostic_concerns = []
-    
-    # Positioning
-    if 'positioning' in assessment:
-        pos = assessment['positioning']
-        quality_scores.append(3 if pos['quality_score'] == PositionQuality.OPTIMAL else 
-                            2 if pos['quality_score'] == PositionQuality.ACCEPTABLE else 1)
-        if pos['quality_score'] == PositionQuality.NON_DIAGNOSTIC:
-            diagnostic_concerns.append("Positioning: Non-diagnostic rotation")
-    
-    # Penetration
-    if 'penetration' in assessment:
-        pen = assessment['penetration']
-        quality_scores.append(3 if pen['quality'] == "optimal" else 2 if "slight" in pen['quality'] else 1)
-        if pen['issues']:
-            diagnostic_concerns.extend(pen['issues'])
-    
-    # Motion
-    if 'motion' in assessment:
-        mot = assessment['motion']
-        if mot['quality'] == "no_motion":
-            quality_scores.append(3)
-        elif mot['quality'] == "mild_motion":
-            quality_scores.append(2)
-        else:
-            quality_scores.append(1)
-            if not mot['is_diagnostic']:
-                diagnostic_concerns.append("Motion: Non-diagnostic blur")
-    
-    # Inspiration
-    if 'inspiration' in assessment:
-        insp = assessment['inspiration']
-        quality_scores.append(3 if insp['quality'] == "adequate" else 
-                            2 if insp['quality'] == "suboptimal" else 1)
-        if insp['quality'] == "poor":
-            diagnostic_concerns.append("Inspiration: Poor effort may obscure findings")
-    
-    # Artifacts
-    if 'artifacts' in assessment:
-        art = assessment['artifacts']
-        if art['severity'] == "None":
-            quality_scores.append(3)
-        elif art['severity'] == "Minimal (no impact)":
-            quality_scores.append(3)
-        elif art['severity'] == "Mild (minor impact)":
-            quality_scores.append(2)
-        else:
-            quality_scores.append(1)
-            if art['affects_diagnosis']:
-                diagnostic_concerns.append(f"Artifacts: {art['severity']}")
-    
-    # Overall assessment
-    avg_score = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+    # Nothing to rate until at least one component form has been saved
+    if all(result is None for result in assessment.values()):
+        st.info("No components saved yet - save an assessment in any tab to see the summary.")
+        return
     
-    if avg_score >= 2.5:
-        overall = "OPTIMAL"
-        color = "green"
-    elif avg_score >= 1.8:
-        overall = "ACCEPTABLE"
-        color = "blue"
-    elif avg_score >= 1.2:
-        overall = "SUBOPTIMAL - Interpret with caution"
-        color = "orange"
-    else:
-        overall = "NON-DIAGNOSTIC - Repeat recommended"
-        color = "red"
+    avg_score, overall, diagnostic_concerns = _aggregate(assessment)
     
     # Display summary card
-    st.markdown(f"""
-    <div style='padding: 20px; border-radius: 10px; background-color: {color}; color: white;'>
-        <h3 style='margin: 0;'>Overall Quality: {overall}</h3>
-        <p style='margin: 5px 0 0 0;'>Score: {avg_score:.1f}/3.0</p>
-    </div>
-    """, unsafe_allow_html=True)
+    col_a, col_b = st.columns(2)
+    col_a.metric("Overall Quality", overall)
+    col_b.progress(avg_score / 3.0, text=f"Score: {avg_score:.1f}/3.0")
     
     # Detailed breakdown
     st.markdown("### Detailed Assessment")
     
     cols = st.columns(5)
     components = [
-        ("Positioning", assessment.get('positioning', {})),
-        ("Penetration", assessment.get('penetration', {})),
-        ("Motion", assessment.get('motion', {})),
-        ("Inspiration", assessment.get('inspiration', {})),
-        ("Artifacts", assessment.get('artifacts', {}))
+        ("Positioning", assessment['positioning']),
+        ("Penetration", assessment['penetration']),
+        ("Motion", assessment['motion']),
+        ("Inspiration", assessment['inspiration']),
+        ("Artifacts", assessment['artifacts'])
     ]
     
     for col, (name, data) in zip(cols, components):
         with col:
             st.markdown(f"**{name}**")
-            if data:
-                if 'quality_score' in data:
-                    st.write(f"Quality: {data['quality_score'].value}")
-                elif 'quality' in data:
-                    st.write(f"Quality: {data['quality']}")
-                elif 'is_diagnostic' in data:
-                    st.write(f"Diagnostic: {'Yes' if data['is_diagnostic'] else 'No'}")
-            else:
+            if data is None:
                 st.write("Not assessed")
+            elif isinstance(data, PositioningResult):
+                st.write(f"Quality: {data.quality_score.label}")
+            elif not isinstance(data, ArtifactResult):
+                st.write(f"Quality: {data.quality}")
     
     # Concerns and recommendations
     if diagnostic_concerns:
@@ -701,43 +783,114 @@ def display_summary(assessment: Dict):
         st.success("Text ready to copy!")
 
 
+def _score_positioning(pos: PositioningResult) -> Tuple[int, Tuple[str, ...]]:
+    concerns = ("Positioning: Non-diagnostic rotation",) if pos.quality_score == PositionQuality.NON_DIAGNOSTIC else ()
+    return max(int(pos.quality_score), 1), concerns
+
+
+def _score_penetration(pen: PenetrationResult) -> Tuple[int, Tuple[str, ...]]:
+    score = 3 if pen.quality == "optimal" else 2 if "slight" in pen.quality else 1
+    return score, pen.issues
+
+
+def _score_motion(mot: MotionResult) -> Tuple[int, Tuple[str, ...]]:
+    if mot.quality == "no_motion":
+        return 3, ()
+    if mot.quality == "mild_motion":
+        return 2, ()
+    return 1, () if mot.is_diagnostic else ("Motion: Non-diagnostic blur",)
+
+
+def _score_inspiration(insp: InspirationResult) -> Tuple[int, Tuple[str, ...]]:
+    if insp.quality == "adequate":
+        return 3, ()
+    if insp.quality == "suboptimal":
+        return 2, ()
+    return 1, ("Inspiration: Poor effort may obscure findings",) if insp.quality == "poor" else ()
+
+
+def _score_artifacts(art: ArtifactResult) -> Tuple[int, Tuple[str, ...]]:
+    if art.severity in ("None", "Minimal (no impact)"):
+        return 3, ()
+    if art.severity == "Mild (minor impact)":
+        return 2, ()
+    return 1, (f"Artifacts: {art.severity}",) if art.affects_diagnosis else ()
+
+
+# Assessment key -> scorer returning (score 1-3, diagnostic concerns)
+_COMPONENT_SCORERS = (
+    ('positioning', _score_positioning),
+    ('penetration', _score_penetration),
+    ('motion', _score_motion),
+    ('inspiration', _score_inspiration),
+    ('artifacts', _score_artifacts)
+)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _aggregate(assessment: Dict) -> Tuple[float, str, Tuple[str, ...]]:
+    """
+    Score the component assessments.
+    
+    Returns (average score, overall label, diagnostic concerns).
+    """
+    quality_scores = []
+    diagnostic_concerns = []
+    
+    for key, scorer in _COMPONENT_SCORERS:
+        result = assessment[key]
+        if result is not None:
+            score, concerns = scorer(result)
+            quality_scores.append(score)
+            diagnostic_concerns.extend(concerns)
+    
+    # Overall assessment
+    avg_score = sum(quality_scores) / len(quality_scores) if quality_scores else 0
+    
+    overall = _QUALITY_TIERS[bisect_right(_TIER_THRESHOLDS, avg_score)]
+    
+    return avg_score, overall, tuple(diagnostic_concerns)
+
+
+# (assessment key, report template, quiet variant) in report order; the
+# quiet variant (attribute, value, template) replaces the template when
+# the attribute has that value. Templates format the result as {r}.
+_REPORT_TEMPLATES = (
+    ('positioning', "Positioning: {r.quality_score.label}. {r.findings}", None),
+    ('penetration', "Penetration: {r.quality}. {r.findings}", None),
+    ('motion', "Motion: {r.quality} present. {r.findings}",
+     ('quality', "no_motion", "Motion: No significant motion. {r.findings}")),
+    ('inspiration', "Inspiration: {r.quality} ({r.posterior_rib_count} posterior ribs). {r.findings}", None),
+    ('artifacts', "Artifacts: {r.severity}. {r.findings}",
+     ('severity', "None", "Artifacts: None significant."))
+)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
 def generate_technical_report(assessment: Dict) -> str:
     """
     Generate structured technical quality text for radiology report.
     """
     lines = ["TECHNICAL QUALITY:"]
     
-    # Positioning
-    if 'positioning' in assessment:
-        pos = assessment['positioning']
-        lines.append(f"Positioning: {pos['quality_score'].value}. {pos.get('findings', 'No significant issues')}")
-    
-    # Penetration
-    if 'penetration' in assessment:
-        pen = assessment['penetration']
-        lines.append(f"Penetration: {pen['quality']}. {pen.get('findings', '')}")
-    
-    # Motion
-    if 'motion' in assessment:
-        mot = assessment['motion']
-        motion_desc = "No significant motion" if mot['quality'] == "no_motion" else f"{mot['quality']} present"
-        lines.append(f"Motion: {motion_desc}. {mot.get('findings', '')}")
-    
-    # Inspiration
-    if 'inspiration' in assessment:
-        insp = assessment['inspiration']
-        lines.append(f"Inspiration: {insp['quality']} ({insp['posterior_rib_count']} posterior ribs). {insp.get('findings', '')}")
-    
-    # Artifacts
-    if 'artifacts' in assessment:
-        art = assessment['artifacts']
-        if art['severity'] != "None":
-            lines.append(f"Artifacts: {art['severity']}. {art.get('findings', '')}")
-        else:
-            lines.append("Artifacts: None significant.")
+    for key, template, quiet in _REPORT_TEMPLATES:
+        result = assessment[key]
+        if result is None:
+            continue
+        if quiet is not None and getattr(result, quiet[0]) == quiet[1]:
+            template = quiet[2]
+        lines.append(template.format(r=result))
     
     return "\n".join(lines)
 
 
 # Export for use in other modules
-__all__ = ['technical_quality_assessor', 'TechnicalAssessment']
+__all__ = [
+    'technical_quality_assessor',
+    'TechnicalAssessment',
+    'PositioningResult',
+    'PenetrationResult',
+    'MotionResult',
+    'InspirationResult',
+    'ArtifactResult'
+]
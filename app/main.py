@@ -1,9 +1,7 @@
 import streamlit as st
-from components.technical_quality import technical_quality_assessor
-from components.anatomy_analyzer import anatomy_systematic_review
-from components.pattern_recognizer import pattern_analysis
-from components.case_study import interactive_case_study
-from components.report_generator import generate_structured_report
+from pathlib import Path
+from importlib import import_module
+from typing import Callable
 
 # Page configuration
 st.set_page_config(
@@ -13,15 +11,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+_CSS_PATH = Path(__file__).resolve().parent / 'static' / 'app.css'
+
+@st.cache_resource
+def _load_css() -> str:
+    """Read the app stylesheet once per process, wrapped in a <style> tag."""
+    return f"<style>\n{_CSS_PATH.read_text()}</style>"
+
 # CSS styling
-st.markdown("""
-<style>
-    .main-header { font-size: 2.5rem; font-weight: bold; color: #1f77b4; }
-    .section-header { font-size: 1.5rem; font-weight: bold; color: #2c3e50; margin-top: 1rem; }
-    .info-box { background-color: #f0f2f6; padding: 1rem; border-radius: 0.5rem; }
-    .checklist-item { margin-left: 1rem; }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 def main():
     st.markdown('<p class="main-header">🫁 Chest X-Ray Systematic Analysis</p>', 
@@ -34,12 +32,7 @@ def main():
     # Sidebar navigation
     with st.sidebar:
         st.header("Analysis Modules")
-        module = st.radio(
-            "Select Module:",
-            ["📋 Technical Quality", "🔍 Systematic Anatomy Review", 
-             "🎯 Pattern Recognition", "📚 Interactive Cases", 
-             "📄 Report Generator", "ℹ️ Knowledge Base"]
-        )
+        module = st.radio("Select Module:", list(_ROUTES))
         
         st.markdown("---")
         st.info("""
@@ -55,22 +48,10 @@ def main():
         """)
     
     # Module routing
-    if "Technical Quality" in module:
-        technical_quality_assessor()
-    elif "Systematic Anatomy" in module:
-        anatomy_systematic_review()
-    elif "Pattern Recognition" in module:
-        pattern_analysis()
-    elif "Interactive Cases" in module:
-        interactive_case_study()
-    elif "Report Generator" in module:
-        generate_structured_report()
-    else:
-        display_knowledge_base()
+    _ROUTES[module]()
 
 def display_knowledge_base():
-    st.markdown('<p class="section-header">Reference Knowledge Base</p>', 
-                unsafe_allow_html=True)
+    st.header("Reference Knowledge Base")
     
     tab1, tab2, tab3 = st.tabs(["Technical Factors", "Anatomic Regions", "Differential Diagnoses"])
     
@@ -125,5 +106,21 @@ def display_knowledge_base():
         for pattern, dd in patterns.items():
             st.markdown(f"**{pattern}:** {dd}")
 
+def _lazy_page(module: str, name: str) -> Callable[[], None]:
+    """Page that imports its component module the first time it is shown."""
+    def page():
+        getattr(import_module(f"components.{module}"), name)()
+    return page
+
+# Sidebar label -> module page; the keys double as the radio options
+_ROUTES = {
+    "📋 Technical Quality": _lazy_page("technical_quality", "technical_quality_assessor"),
+    "🔍 Systematic Anatomy Review": _lazy_page("anatomy_analyzer", "anatomy_systematic_review"),
+    "🎯 Pattern Recognition": _lazy_page("pattern_recognizer", "pattern_analysis"),
+    "📚 Interactive Cases": _lazy_page("case_study", "interactive_case_study"),
+    "📄 Report Generator": _lazy_page("report_generator", "generate_structured_report"),
+    "ℹ️ Knowledge Base": display_knowledge_base
+}
+
 if __name__ == "__main__":
     main()
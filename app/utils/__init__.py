@@ -1,11 +1,13 @@
 """
 Utility functions for CXR analysis application
 
-Includes image processing, annotation tools, and helper functions.
+Includes image processing, annotation tools, knowledge base access,
+and helper functions.
 """
 
 from .image_processing import (
     load_cxr_image,
+    load_and_inspect,
     preprocess_image,
     adjust_contrast,
     detect_rotation,
@@ -14,16 +16,19 @@ from .image_processing import (
 from .annotations import (
     add_annotation,
     draw_measurements,
-    highlight_region
+    highlight_region,
+    highlight_regions
 )
 from .helpers import (
     validate_image_format,
     calculate_ctr,
     get_differential_diagnosis
 )
+from .knowledge_base import get_kb
 
 __all__ = [
     "load_cxr_image",
+    "load_and_inspect",
     "preprocess_image", 
     "adjust_contrast",
     "detect_rotation",
@@ -31,7 +36,9 @@ __all__ = [
     "add_annotation",
     "draw_measurements",
     "highlight_region",
+    "highlight_regions",
     "validate_image_format",
     "calculate_ctr",
-    "get_differential_diagnosis"
+    "get_differential_diagnosis",
+    "get_kb"
 ]
@@ -7,6 +7,7 @@ Provides drawing and annotation capabilities for educational purposes.
 from PIL import Image, ImageDraw, ImageFont
 import streamlit as st
 from typing import List, Tuple, Dict, Optional
+from functools import lru_cache
 import json
 
 
@@ -28,13 +29,27 @@ def add_annotation(image: Image.Image,
     Returns:
         Annotated image
     """
-    draw = ImageDraw.Draw(image)
-    
-    # Try to load font, fall back to default
+    _draw_label(ImageDraw.Draw(image), text, position, color, font_size)
+    return image
+
+
+@lru_cache(maxsize=32)
+def _get_font(size: int):
+    """Load the label font once per size, falling back to PIL's default."""
     try:
-        font = ImageFont.truetype("arial.ttf", font_size)
-    except:
-        font = ImageFont.load_default()
+        return ImageFont.truetype("arial.ttf", size)
+    except (OSError, ImportError):
+        # OSError: font file missing; ImportError: Pillow built without FreeType
+        return ImageFont.load_default()
+
+
+def _draw_label(draw: ImageDraw.ImageDraw,
+                text: str,
+                position: Tuple[int, int],
+                color: str,
+                font_size: int = 20):
+    """Draw a text label on a yellow box through an existing draw context."""
+    font = _get_font(font_size)
     
     # Draw text with background
     x, y = position
@@ -48,8 +63,6 @@ def add_annotation(image: Image.Image,
     
     # Draw text
     draw.text((x, y), text, fill=color, font=font)
-    
-    return image
 
 
 def draw_measurements(image: Image.Image,
@@ -83,7 +96,7 @@ def draw_measurements(image: Image.Image,
     if label:
         mid_x = (start[0] + end[0]) // 2
         mid_y = (start[1] + end[1]) // 2
-        add_annotation(image, label, (mid_x, mid_y - 20), color)
+        _draw_label(draw, label, (mid_x, mid_y - 20), color)
     
     return image
 
@@ -106,7 +119,44 @@ def highlight_region(image: Image.Image,
     Returns:
         Image with highlight
     """
+    _draw_highlight(ImageDraw.Draw(image), bbox, label, color, style)
+    return image
+
+
+def highlight_regions(image: Image.Image,
+                     bboxes: List[Tuple[int, int, int, int]],
+                     labels: Optional[List[Optional[str]]] = None,
+                     color: str = "yellow",
+                     style: str = "rectangle") -> Image.Image:
+    """
+    Highlight several regions of interest through one draw context.
+    
+    Args:
+        image: Input PIL Image
+        bboxes: (x1, y1, x2, y2) bounding boxes
+        labels: Optional label per box (None entries are skipped)
+        color: Highlight color
+        style: 'rectangle', 'circle', or 'arrow'
+    
+    Returns:
+        Image with highlights
+    """
     draw = ImageDraw.Draw(image)
+    if labels is None:
+        labels = [None] * len(bboxes)
+    
+    for bbox, label in zip(bboxes, labels):
+        _draw_highlight(draw, bbox, label, color, style)
+    
+    return image
+
+
+def _draw_highlight(draw: ImageDraw.ImageDraw,
+                    bbox: Tuple[int, int, int, int],
+                    label: Optional[str],
+                    color: str,
+                    style: str):
+    """Draw one highlight (and its label) through an existing draw context."""
     x1, y1, x2, y2 = bbox
     
     if style == "rectangle":
@@ -124,9 +174,7 @@ def highlight_region(image: Image.Image,
         draw.polygon([(x1, y1), (x1-10, y1-5), (x1-5, y1-10)], fill=color)
     
     if label:
-        add_annotation(image, label, (x1, y1 - 25), color)
-    
-    return image
+        _draw_label(draw, label, (x1, y1 - 25), color)
 
 
 def draw_anatomy_overlay(image: Image.Image,
@@ -177,7 +225,7 @@ def draw_anatomy_overlay(image: Image.Image,
                      fill=zone_color, width=2)
             
             # Zone label
-            add_annotation(image, zone_name, (10, y_start + 10), zone_color)
+            _draw_label(draw, zone_name, (10, y_start + 10), zone_color)
     
     return image
 
@@ -221,10 +269,7 @@ def create_comparison_view(image1: Image.Image,
     
     # Add labels
     draw = ImageDraw.Draw(combined)
-    try:
-        font = ImageFont.truetype("arial.ttf", 20)
-    except:
-        font = ImageFont.load_default()
+    font = _get_font(20)
     
     # Center labels
     label1_x = (image1.width - len(label1) * 10) // 2
@@ -242,6 +287,9 @@ def save_annotations(image: Image.Image,
     """
     Save image with annotations and metadata.
     
+    The metadata is stored column-wise ({key: [value per annotation]})
+    so each key is written once instead of once per annotation.
+    
     Args:
         image: Annotated image
         annotations: List of annotation dictionaries
@@ -253,14 +301,44 @@ def save_annotations(image: Image.Image,
     # Save metadata
     meta_filename = filename.rsplit('.', 1)[0] + '.json'
     with open(meta_filename, 'w') as f:
-        json.dump(annotations, f, indent=2)
+        json.dump(_to_soa(annotations), f, separators=(',', ':'))
+
+
+def load_annotations(filename: str) -> List[Dict]:
+    """
+    Load the annotation metadata written by save_annotations.
+    
+    Args:
+        filename: Image filename passed to save_annotations
+    
+    Returns:
+        List of annotation dictionaries (keys missing from an annotation
+        when it was saved come back as None)
+    """
+    meta_filename = filename.rsplit('.', 1)[0] + '.json'
+    with open(meta_filename) as f:
+        return _from_soa(json.load(f))
+
+
+def _to_soa(annotations: List[Dict]) -> Dict[str, list]:
+    """Turn a list of annotation dicts into one list per key."""
+    keys = dict.fromkeys(key for annotation in annotations for key in annotation)
+    return {key: [annotation.get(key) for annotation in annotations] for key in keys}
+
+
+def _from_soa(columns: Dict[str, list]) -> List[Dict]:
+    """Inverse of _to_soa."""
+    keys = list(columns)
+    return [dict(zip(keys, row)) for row in zip(*columns.values())]
 
 
 __all__ = [
     'add_annotation',
     'draw_measurements',
     'highlight_region',
+    'highlight_regions',
     'draw_anatomy_overlay',
     'create_comparison_view',
-    'save_annotations'
+    'save_annotations',
+    'load_annotations'
 ]
@@ -5,6 +5,28 @@ Helper functions for CXR analysis
 import re
 from typing import List, Dict
 
+# First run of digits in a rib-count description
+_RIB_RE = re.compile(r'\d+')
+
+# (pattern, distribution) -> differential diagnosis
+# This would connect to knowledge base
+_DIFFERENTIALS = {
+    ("reticular", "basal"): (
+        "Usual Interstitial Pneumonia (IPF)",
+        "Nonspecific Interstitial Pneumonia",
+        "Asbestosis",
+        "Collagen vascular disease"
+    ),
+    ("nodular", "upper"): (
+        "Sarcoidosis",
+        "Silicosis",
+        "Tuberculosis",
+        "Langerhans cell histiocytosis"
+    )
+    # Add more combinations...
+}
+_DEFAULT_DIFFERENTIAL = ("Consider clinical correlation",)
+
 
 def validate_image_format(filename: str) -> bool:
     """Validate if file is acceptable medical image format."""
@@ -39,27 +61,10 @@ def get_differential_diagnosis(pattern: str, distribution: str) -> List[str]:
     Returns:
         List of differential diagnoses
     """
-    # This would connect to knowledge base
-    differentials = {
-        ("reticular", "basal"): [
-            "Usual Interstitial Pneumonia (IPF)",
-            "Nonspecific Interstitial Pneumonia",
-            "Asbestosis",
-            "Collagen vascular disease"
-        ],
-        ("nodular", "upper"): [
-            "Sarcoidosis",
-            "Silicosis",
-            "Tuberculosis",
-            "Langerhans cell histiocytosis"
-        ]
-        # Add more combinations...
-    }
-    
-    return differentials.get((pattern, distribution), ["Consider clinical correlation"])
+    return list(_DIFFERENTIALS.get((pattern, distribution), _DEFAULT_DIFFERENTIAL))
 
 
 def parse_rib_count(description: str) -> int:
     """Extract rib count from text description."""
-    numbers = re.findall(r'\d+', description)
-    return int(numbers[0]) if numbers else 0
+    match = _RIB_RE.search(description)
+    return int(match.group()) if match else 0
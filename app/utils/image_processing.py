@@ -10,6 +10,7 @@ from PIL import Image, ImageEnhance, ImageFilter
 import streamlit as st
 from typing import Tuple, Optional, Dict, Union
 import io
+import math
 import base64
 
 
@@ -23,23 +24,52 @@ def load_cxr_image(uploaded_file) -> Optional[Image.Image]:
     Returns:
         PIL Image object or None if invalid
     """
+    return load_and_inspect(uploaded_file)[0]
+
+
+def load_and_inspect(uploaded_file) -> Tuple[Optional[Image.Image], Dict]:
+    """
+    Load a CXR upload and collect its metadata from a single read.
+    
+    Use this instead of calling load_cxr_image and get_image_metadata
+    separately, which copies and parses the upload twice.
+    
+    Args:
+        uploaded_file: Streamlit uploaded file object
+    
+    Returns:
+        (grayscale PIL Image or None if invalid, metadata dictionary)
+    """
+    metadata = {
+        'filename': uploaded_file.name if uploaded_file else None,
+        'size_bytes': 0,
+        'format': None,
+        'mode': None,
+        'dimensions': None
+    }
+    
     try:
         if uploaded_file is None:
-            return None
+            return None, metadata
         
         # Read file
         bytes_data = uploaded_file.getvalue()
+        metadata['size_bytes'] = len(bytes_data)
         image = Image.open(io.BytesIO(bytes_data))
+        metadata['format'] = image.format
+        metadata['mode'] = image.mode
+        metadata['dimensions'] = image.size
         
         # Convert to grayscale if RGB
         if image.mode != 'L':
             image = image.convert('L')
         
-        return image
+        return image, metadata
     
     except Exception as e:
+        metadata['error'] = str(e)
         st.error(f"Error loading image: {str(e)}")
-        return None
+        return None, metadata
 
 
 def preprocess_image(image: Image.Image, 
@@ -58,14 +88,30 @@ def preprocess_image(image: Image.Image,
     Returns:
         Processed PIL Image
     """
-    # Apply adjustments
-    if contrast != 1.0:
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(contrast)
-    
-    if brightness != 1.0:
-        enhancer = ImageEnhance.Brightness(image)
-        image = enhancer.enhance(brightness)
+    if image.mode != 'L':
+        # Other modes keep the enhancer chain: Contrast pivots on the
+        # grayscale mean, and Brightness leaves alpha untouched
+        if contrast != 1.0:
+            image = ImageEnhance.Contrast(image).enhance(contrast)
+        if brightness != 1.0:
+            image = ImageEnhance.Brightness(image).enhance(brightness)
+    
+    elif contrast != 1.0 or brightness != 1.0:
+        # Contrast and brightness are both per-pixel blends, so fold them
+        # into one 256-entry lookup table (same rounding and clipping as
+        # ImageEnhance) and apply it in a single pass
+        img_array = np.asarray(image)
+        lut = np.arange(256, dtype=np.float32)
+        
+        if contrast != 1.0:
+            # ImageEnhance.Contrast blends towards the rounded mean gray level
+            mean = int(img_array.mean() + 0.5)
+            lut = np.clip(np.trunc(mean + np.float32(contrast) * (lut - mean)), 0, 255)
+        
+        if brightness != 1.0:
+            lut = np.clip(np.trunc(np.float32(brightness) * lut), 0, 255)
+        
+        image = Image.fromarray(lut.astype(np.uint8)[img_array])
     
     if sharpness != 1.0:
         enhancer = ImageEnhance.Sharpness(image)
@@ -81,34 +127,106 @@ def adjust_contrast(image: Image.Image,
     Apply contrast enhancement using various methods.
     
     Args:
-        image: Input PIL Image
+        image: Input PIL Image (converted to 8-bit grayscale if it isn't already)
         method: 'adaptive', 'histogram', or 'linear'
         clip_limit: Clip limit for adaptive histogram equalization
     
     Returns:
-        Contrast-enhanced image
+        Contrast-enhanced grayscale image
     """
-    # Convert to numpy array
-    img_array = np.array(image)
+    # The equalizers work on a single 8-bit channel
+    if image.mode != 'L':
+        image = image.convert('L')
     
+    # Convert to numpy array
+    img_array = np.asarray(image)
+
     if method == "adaptive":
         # Adaptive histogram equalization (CLAHE)
-        # This is a simplified version - full implementation would use cv2
-        from PIL import ImageOps
-        return ImageOps.equalize(image)
-    
+        return Image.fromarray(_clahe(img_array, clip_limit))
+
     elif method == "histogram":
         # Global histogram equalization
-        from PIL import ImageOps
-        return ImageOps.equalize(image)
-    
+        return Image.fromarray(_equalize(img_array))
+
     else:  # linear
-        # Linear stretch
-        img_min, img_max = img_array.min(), img_array.max()
+        # Linear stretch; an image that already spans 0-255 (or is flat)
+        # has nothing to stretch, so skip the float round-trip
+        img_min, img_max = int(img_array.min()), int(img_array.max())
+        if (img_min == 0 and img_max == 255) or img_min == img_max:
+            return image
         stretched = ((img_array - img_min) / (img_max - img_min) * 255).astype(np.uint8)
         return Image.fromarray(stretched)
 
 
+# CLAHE splits the image into a _CLAHE_GRID x _CLAHE_GRID grid of tiles
+_CLAHE_GRID = 8
+
+
+def _equalize(img_array: np.ndarray) -> np.ndarray:
+    """Global histogram equalization of a uint8 array through a 256-entry LUT."""
+    hist = np.bincount(img_array.ravel(), minlength=256)
+    cdf = hist.cumsum()
+    cdf_min = cdf[np.flatnonzero(hist)[0]]
+    span = cdf[-1] - cdf_min
+    if span == 0:
+        return img_array
+
+    lut = np.clip((cdf - cdf_min) * 255 // span, 0, 255).astype(np.uint8)
+    return lut[img_array]
+
+
+def _tile_weights(size: int, tile: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Nearest tile indices and blend weight for each pixel along one axis."""
+    pos = (np.arange(size) + 0.5) / tile - 0.5
+    lo = np.clip(np.floor(pos).astype(np.intp), 0, _CLAHE_GRID - 1)
+    hi = np.minimum(lo + 1, _CLAHE_GRID - 1)
+    weight = np.clip(pos - lo, 0, 1).astype(np.float32)
+    return lo, hi, weight
+
+
+def _clahe(img_array: np.ndarray, clip_limit: float) -> np.ndarray:
+    """
+    Contrast-limited adaptive histogram equalization of a 2-D uint8 array.
+
+    Builds a clipped, equalized LUT per tile and bilinearly blends the
+    four nearest tile LUTs at each pixel.
+    """
+    grid = _CLAHE_GRID
+    height, width = img_array.shape
+    tile_h, tile_w = -(-height // grid), -(-width // grid)
+
+    # Pad to a whole number of tiles and lay the tiles out as rows
+    padded = np.pad(img_array,
+                    ((0, tile_h * grid - height), (0, tile_w * grid - width)),
+                    mode='edge')
+    tiles = padded.reshape(grid, tile_h, grid, tile_w).swapaxes(1, 2)
+    tiles = tiles.reshape(grid * grid, -1)
+
+    # One bincount for every tile: each tile gets its own block of 256 bins
+    offsets = np.arange(grid * grid)[:, None] * 256
+    hist = np.bincount((tiles + offsets).ravel(), minlength=grid * grid * 256)
+    hist = hist.reshape(grid, grid, 256).astype(np.float32)
+
+    # Clip each histogram and spread the excess evenly over all bins
+    limit = max(clip_limit * tile_h * tile_w / 256, 1.0)
+    excess = np.maximum(hist - limit, 0).sum(axis=-1, keepdims=True)
+    hist = np.minimum(hist, limit) + excess / 256
+
+    cdf = hist.cumsum(axis=-1)
+    luts = cdf * (255 / cdf[..., -1:])
+
+    # Bilinear blend between the four surrounding tile LUTs
+    y0, y1, wy = _tile_weights(height, tile_h)
+    x0, x1, wx = _tile_weights(width, tile_w)
+    y0, y1, wy = y0[:, None], y1[:, None], wy[:, None]
+
+    top = luts[y0, x0, img_array] * (1 - wx) + luts[y0, x1, img_array] * wx
+    bottom = luts[y1, x0, img_array] * (1 - wx) + luts[y1, x1, img_array] * wx
+    blended = top * (1 - wy) + bottom * wy
+    return (blended + 0.5).astype(np.uint8)
+
+
 def detect_rotation(image: Image.Image) -> Dict:
     """
     Analyze image for rotation/positioning quality.
@@ -122,17 +240,20 @@ def detect_rotation(image: Image.Image) -> Dict:
     Returns:
         Dictionary with rotation analysis results
     """
-    img_array = np.array(image)
+    img_array = np.asarray(image)
     height, width = img_array.shape
     
-    # Split image vertically
-    left_half = img_array[:, :width//2]
-    right_half = np.fliplr(img_array[:, width//2:])
-    
-    # Calculate symmetry score (simplified)
-    min_width = min(left_half.shape[1], right_half.shape[1])
-    symmetry_diff = np.abs(left_half[:, :min_width] - right_half[:, :min_width])
-    symmetry_score = 1 - (np.mean(symmetry_diff) / 255)
+    # Split image vertically; the right half is a mirrored view, not a copy
+    half = width // 2
+    left_half = img_array[:, :half]
+    right_half = img_array[:, :width - half - 1:-1]
+
+    # Calculate symmetry score (simplified). Subtract in int16 so uint8
+    # pixels don't wrap around, take the abs in place and sum as integers.
+    symmetry_diff = np.subtract(left_half, right_half, dtype=np.int16)
+    np.abs(symmetry_diff, out=symmetry_diff)
+    mean_diff = int(symmetry_diff.sum(dtype=np.int64)) / symmetry_diff.size
+    symmetry_score = 1 - (mean_diff / 255)
     
     # Determine rotation status
     if symmetry_score > 0.85:
@@ -163,11 +284,21 @@ def assess_penetration(image: Image.Image) -> Dict:
     Returns:
         Dictionary with penetration assessment
     """
-    img_array = np.array(image)
+    img_array = np.asarray(image)
     
     # Calculate statistics
-    mean_intensity = np.mean(img_array)
-    std_intensity = np.std(img_array)
+    if img_array.dtype == np.uint8:
+        # One histogram pass: exact integer sum and sum of squares over the
+        # 256 gray levels give both mean and std
+        hist = np.bincount(img_array.ravel(), minlength=256)
+        levels = np.arange(256, dtype=np.int64)
+        n_pixels = int(hist.sum())
+        mean_intensity = int(hist @ levels) / n_pixels
+        mean_square = int(hist @ (levels * levels)) / n_pixels
+        std_intensity = math.sqrt(max(mean_square - mean_intensity ** 2, 0.0))
+    else:
+        mean_intensity = np.mean(img_array)
+        std_intensity = np.std(img_array)
     
     # Define regions (simplified - would use segmentation in production)
     height, width = img_array.shape
@@ -300,16 +431,17 @@ def get_image_metadata(uploaded_file) -> Dict:
     Returns:
         Dictionary with metadata
     """
+    bytes_data = uploaded_file.getvalue() if uploaded_file else b''
     metadata = {
         'filename': uploaded_file.name if uploaded_file else None,
-        'size_bytes': len(uploaded_file.getvalue()) if uploaded_file else 0,
+        'size_bytes': len(bytes_data),
         'format': None,
         'mode': None,
         'dimensions': None
     }
     
     try:
-        image = Image.open(io.BytesIO(uploaded_file.getvalue()))
+        image = Image.open(io.BytesIO(bytes_data))
         metadata['format'] = image.format
         metadata['mode'] = image.mode
         metadata['dimensions'] = image.size
@@ -331,9 +463,31 @@ def create_thumbnail(image: Image.Image,
     Returns:
         Thumbnail image
     """
-    thumb = image.copy()
-    thumb.thumbnail(max_size)
-    return thumb
+    # Resize straight from the source instead of copying it at full size
+    # first and shrinking the copy with Image.thumbnail
+    size = _thumbnail_size(image.size, max_size)
+    if size == image.size:
+        return image.copy()
+    return image.resize(size, reducing_gap=2.0)
+
+
+def _thumbnail_size(image_size: Tuple[int, int],
+                    max_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Output size Image.thumbnail would pick, including its aspect-preserving rounding."""
+    width, height = image_size
+    x, y = math.floor(max_size[0]), math.floor(max_size[1])
+    if x >= width and y >= height:
+        return image_size
+
+    def round_aspect(number, key):
+        return max(min(math.floor(number), math.ceil(number), key=key), 1)
+
+    aspect = width / height
+    if x / y >= aspect:
+        x = round_aspect(y * aspect, key=lambda n: abs(aspect - n / y))
+    else:
+        y = round_aspect(x / aspect, key=lambda n: 0 if n == 0 else abs(aspect - x / n))
+    return x, y
 
 
 def apply_window_level(image: Image.Image,
@@ -350,17 +504,27 @@ def apply_window_level(image: Image.Image,
     Returns:
         Windowed image
     """
-    img_array = np.array(image).astype(float)
-    
     # Calculate window bounds
     min_val = window_center - window_width // 2
     max_val = window_center + window_width // 2
+
+    img_array = np.asarray(image)
+    
+    # For 8-bit input the mapping only depends on the pixel value, so window
+    # the 256 possible values once and gather through that lookup table;
+    # higher bit depths are windowed pixel by pixel
+    is_8bit = img_array.dtype == np.uint8
+    values = np.arange(256) if is_8bit else img_array.astype(float)
     
     # Apply window
-    windowed = np.clip(img_array, min_val, max_val)
-    windowed = ((windowed - min_val) / (max_val - min_val) * 255).astype(np.uint8)
+    if max_val == min_val:
+        # Zero-width window: threshold at the window center
+        windowed = np.where(values >= window_center, 255, 0).astype(np.uint8)
+    else:
+        windowed = np.clip(values, min_val, max_val)
+        windowed = ((windowed - min_val) / (max_val - min_val) * 255).astype(np.uint8)
     
-    return Image.fromarray(windowed)
+    return Image.fromarray(windowed[img_array] if is_8bit else windowed)
 
 
 def measure_distance(image: Image.Image,
@@ -382,22 +546,37 @@ def measure_distance(image: Image.Image,
     x1, y1 = point1
     x2, y2 = point2
     
-    pixel_distance = np.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    pixel_distance = math.hypot(x2 - x1, y2 - y1)
     
     result = {
-        'pixel_distance': float(pixel_distance),
+        'pixel_distance': pixel_distance,
         'point1': point1,
         'point2': point2
     }
     
     if calibration:
         real_distance = pixel_distance / calibration
-        result['calibrated_distance'] = float(real_distance)
+        result['calibrated_distance'] = real_distance
         result['units'] = 'cm'  # or whatever unit calibration represents
     
     return result
 
 
+def _diff_variance(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Variance of the pixel differences a - b.
+
+    Subtracts once into a float64 buffer (no uint8 wraparound) and gets the
+    variance from its sum and sum of squares, instead of the separate
+    mean/deviation/square passes np.var makes over a fresh temporary.
+    """
+    diff = np.subtract(a, b, dtype=np.float64).ravel()
+    if diff.size == 0:
+        return 0.0
+    mean = diff.sum() / diff.size
+    return max(float(np.dot(diff, diff)) / diff.size - mean * mean, 0.0)
+
+
 def detect_grid_lines(image: Image.Image) -> Dict:
     """
     Detect potential grid lines or artifacts in image.
@@ -408,14 +587,14 @@ def detect_grid_lines(image: Image.Image) -> Dict:
     Returns:
         Dictionary with artifact detection results
     """
-    img_array = np.array(image)
+    img_array = np.asarray(image)
     
     # Simple detection based on periodic patterns
     # In production, would use Fourier analysis or Hough transform
     
     # Check for horizontal lines
-    horizontal_variance = np.var(np.diff(img_array, axis=0))
-    vertical_variance = np.var(np.diff(img_array, axis=1))
+    horizontal_variance = _diff_variance(img_array[1:, :], img_array[:-1, :])
+    vertical_variance = _diff_variance(img_array[:, 1:], img_array[:, :-1])
     
     # High variance in one direction suggests lines in that direction
     has_horizontal_lines = horizontal_variance > 1000
@@ -430,19 +609,28 @@ def detect_grid_lines(image: Image.Image) -> Dict:
     }
 
 
-def image_to_base64(image: Image.Image, format: str = "PNG") -> str:
+def image_to_base64(image: Image.Image,
+                    format: str = "PNG",
+                    compression: int = 3) -> str:
     """
     Convert PIL Image to base64 string for embedding.
     
     Args:
         image: Input image
-        format: Image format
+        format: Image format ('WEBP' is encoded lossless at libwebp's fastest setting)
+        compression: PNG zlib level 0-9; lower is faster, output stays lossless
     
     Returns:
         Base64 encoded string
     """
+    save_options = {}
+    if format.upper() == "PNG":
+        save_options['compress_level'] = compression
+    elif format.upper() == "WEBP":
+        save_options.update(lossless=True, method=0)
+    
     buffered = io.BytesIO()
-    image.save(buffered, format=format)
+    image.save(buffered, format=format, **save_options)
     img_str = base64.b64encode(buffered.getvalue()).decode()
     return f"data:image/{format.lower()};base64,{img_str}"
 
@@ -450,6 +638,7 @@ def image_to_base64(image: Image.Image, format: str = "PNG") -> str:
 # Export all functions
 __all__ = [
     'load_cxr_image',
+    'load_and_inspect',
     'preprocess_image',
     'adjust_contrast',
     'detect_rotation',
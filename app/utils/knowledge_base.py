@@ -0,0 +1,33 @@
+"""
+Knowledge base access for CXR analysis
+
+Loads the reference terminology once per process and shares it,
+read-only, across all sessions.
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import orjson
+import streamlit as st
+
+# Resolved from this file so loading does not depend on the working directory
+_KB_PATH = Path(__file__).resolve().parent.parent / 'data' / 'knowledge_base.json'
+
+
+@st.cache_resource
+def get_kb(path: Path = _KB_PATH) -> Mapping[str, Any]:
+    """
+    Load the reference knowledge base.
+    
+    Args:
+        path: Path to knowledge base JSON file
+    
+    Returns:
+        Read-only mapping of the parsed knowledge base
+    """
+    return MappingProxyType(orjson.loads(path.read_bytes()))
+
+
+__all__ = ['get_kb']
@@ -44,19 +44,21 @@ class PatternMatcher:
     
     def _load_patterns(self):
         """Load pattern definitions from knowledge base."""
+        # Sets are built once here so scoring never rebuilds them per call
         return {
             'reticular': {
-                'features': ['linear_opacities', 'interstitial_thickening'],
-                'distributions': ['basal', 'peripheral']
+                'features': frozenset(['linear_opacities', 'interstitial_thickening']),
+                'distributions': frozenset(['basal', 'peripheral'])
             },
             'nodular': {
-                'features': ['round_opacities', 'multiple_nodules'],
-                'distributions': ['upper', 'random']
+                'features': frozenset(['round_opacities', 'multiple_nodules']),
+                'distributions': frozenset(['upper', 'random'])
             }
         }
     
-    def match_pattern(self, features: list, distribution: str) -> dict:
-        """Match observed features to known patterns."""
+    def match_pattern(self, features, distribution: str) -> dict:
+        """Match observed features (any iterable, ideally a frozenset) to known patterns."""
+        features = frozenset(features)
         matches = {}
         for pattern_name, pattern_data in self.patterns.items():
             score = self._calculate_match_score(features, distribution, pattern_data)
@@ -65,7 +67,7 @@ class PatternMatcher:
     
     def _calculate_match_score(self, features, distribution, pattern_data):
         """Calculate how well features match a pattern."""
-        feature_score = len(set(features) & set(pattern_data['features']))
+        feature_score = len(features & pattern_data['features'])
         dist_score = 1 if distribution in pattern_data['distributions'] else 0
         return (feature_score + dist_score) / (len(pattern_data['features']) + 1)
       